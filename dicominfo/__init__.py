@@ -8,6 +8,7 @@ from dicominfo._version import __version__
 from dicominfo.cli import main
 from dicominfo.core import print_stats, validate_files
 from dicominfo.exceptions import (
+    DicomInfoError,
     DicomReadError,
     NoPixelDataError,
     UnsupportedPixelDataError,
@@ -25,6 +26,7 @@ def __getattr__(name: str) -> Callable:
 
 
 __all__ = [
+    "DicomInfoError",
     "DicomReadError",
     "NoPixelDataError",
     "UnsupportedPixelDataError",
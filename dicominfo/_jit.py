@@ -0,0 +1,32 @@
+"""Numba-compiled versions of the kernels in :mod:`dicominfo._kernels`."""
+
+from __future__ import annotations
+
+# Typing
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+# Module imports
+import numba
+import numpy as np
+
+
+@numba.njit(fastmath=True, cache=True)
+def window_level_u8(
+    src: ndarray,
+    vmin: float,
+    scale: float,
+    dst: ndarray,
+) -> ndarray:  # pragma: no cover - compiled by numba
+    """Numba version of :func:`dicominfo._kernels.window_level_u8`."""
+    for i in range(src.shape[0]):
+        for j in range(src.shape[1]):
+            value = (src[i, j] - vmin) * scale
+            if value < 0:
+                value = 0.0
+            elif value > 255:  # noqa: PLR2004
+                value = 255.0
+            dst[i, j] = np.uint8(value)
+    return dst
@@ -0,0 +1,80 @@
+"""Array kernels for display preparation, compiled with Numba when available."""
+
+from __future__ import annotations
+
+# Typing
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from numpy import ndarray
+
+# Python imports
+from functools import lru_cache
+from importlib.util import find_spec
+
+# Module imports
+import numpy as np
+
+# Numba is slow to import, so its kernels in dicominfo._jit are only
+# imported on first use
+HAS_NUMBA = find_spec("numba") is not None
+
+
+@lru_cache(maxsize=1)
+def _load_jit() -> ModuleType | None:
+    """
+    Import the Numba kernels, once.
+
+    Returns:
+        The :mod:`dicominfo._jit` module, or None if Numba is missing or
+        fails to import, in which case the NumPy kernels are used.
+
+    """
+    if not HAS_NUMBA:
+        return None
+    try:
+        from dicominfo import _jit  # noqa: PLC0415
+    except ImportError:
+        return None
+    return _jit
+
+
+def _window_level_u8_numpy(
+    src: ndarray,
+    vmin: float,
+    scale: float,
+    dst: ndarray,
+) -> ndarray:
+    """NumPy version of :func:`window_level_u8`."""
+    np.copyto(dst, np.clip((src - vmin) * scale, 0, 255), casting="unsafe")
+    return dst
+
+
+def window_level_u8(
+    src: ndarray,
+    vmin: float,
+    scale: float,
+    dst: ndarray,
+) -> ndarray:
+    """
+    Window a 2D slice to uint8 in a single pass.
+
+    Computes ``clip((src - vmin) * scale, 0, 255)`` into ``dst``. With
+    Numba this is one fused loop rather than a NumPy pass per operation.
+
+    Args:
+        src: 2D numpy array
+        vmin: Value mapped to 0
+        scale: Factor mapping ``vmax - vmin`` onto 255
+        dst: Preallocated uint8 array with the same shape as ``src``
+
+    Returns:
+        ``dst``, filled with the windowed slice.
+
+    """
+    jit = _load_jit()
+    if jit is not None:
+        return jit.window_level_u8(src, vmin, scale, dst)
+    return _window_level_u8_numpy(src, vmin, scale, dst)
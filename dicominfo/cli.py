@@ -8,15 +8,34 @@ import sys
 
 from dicominfo._version import __version__
 from dicominfo.core import print_stats
-from dicominfo.exceptions import (
-    DicomReadError,
-    NoPixelDataError,
-    UnsupportedPixelDataError,
-)
+from dicominfo.exceptions import DicomInfoError
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_tags(value: str) -> list[str]:
+    """
+    Parse a comma-separated list of DICOM keywords.
+
+    Raises:
+        argparse.ArgumentTypeError: If no keywords are given, or a keyword
+            is not in the DICOM dictionary.
+
+    """
+    # pydicom is only imported when tags are given
+    from pydicom.datadict import tag_for_keyword  # noqa: PLC0415
+
+    keywords = [keyword.strip() for keyword in value.split(",") if keyword.strip()]
+    if not keywords:
+        msg = "no DICOM keywords given"
+        raise argparse.ArgumentTypeError(msg)
+    unknown = [keyword for keyword in keywords if tag_for_keyword(keyword) is None]
+    if unknown:
+        msg = f"unknown DICOM keyword(s): {', '.join(unknown)}"
+        raise argparse.ArgumentTypeError(msg)
+    return keywords
+
+
 def main() -> None:
     """Entry point for the CLI."""
     parser = argparse.ArgumentParser(
@@ -51,6 +70,16 @@ def main() -> None:
         default=None,
     )
 
+    parser.add_argument(
+        "-t",
+        "--tags",
+        help="Comma-separated DICOM keywords to print, e.g. PatientName,Modality. "
+        "Only these elements are read. Only affects printed metadata, so it "
+        "cannot be combined with --quiet.",
+        type=_parse_tags,
+        default=None,
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -76,6 +105,9 @@ def main() -> None:
     else:
         logging.basicConfig(level=logging.INFO, format=fmt)
 
+    if args.tags is not None and args.quiet:
+        parser.error("--tags has no effect with --quiet")
+
     # Validate columns argument
     if args.columns is not None and args.columns < 1:
         msg = "--columns must be a positive integer"
@@ -87,7 +119,7 @@ def main() -> None:
     try:
         # Only print stats if not in quiet mode
         if not args.quiet:
-            print_stats(args.file)
+            print_stats(args.file, tags=args.tags)
         else:
             # In quiet mode, still need to validate files can be read
             # but don't print the metadata
@@ -101,6 +133,6 @@ def main() -> None:
 
             display_images(args.file, max_cols=args.columns)
 
-    except (DicomReadError, NoPixelDataError, UnsupportedPixelDataError) as err:
+    except DicomInfoError as err:
         print(err)
         sys.exit(1)
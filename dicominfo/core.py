@@ -1,21 +1,183 @@
 """Core DICOM file I/O and metadata extraction."""
 
-# ruff: noqa: T201
-
 from __future__ import annotations
 
-from dicominfo.utils import load_dicom_files
+# Type Checking
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+    from typing import BinaryIO
+
+    from pydicom import Dataset
+    from pydicom.dataelem import DataElement, RawDataElement
+    from pydicom.tag import BaseTag
+
+# Python imports
+import io
+import sys
+from functools import lru_cache
+
+from dicominfo.utils import check_dicom_files, load_dicom_files
+
+# Elements larger than this are only read from disk when their value is used
+_DEFER_SIZE = "1 KB"
+
+# Byte VRs whose printed summary depends only on the element's length
+_SUMMARISED_VRS = frozenset({"OB", "OD", "OF", "OL", "OV", "OW"})
+
+
+@lru_cache(maxsize=4096)
+def _element_name(tag: BaseTag, vr: str, private_creator: str | None) -> str:
+    """Return pydicom's dictionary name for an element, cached per tag."""
+    from pydicom.dataelem import DataElement  # noqa: PLC0415
+
+    elem = DataElement(tag, vr, None)
+    elem.private_creator = private_creator
+    return elem.name
+
+
+def _element_prefix(tag: BaseTag, vr: str, private_creator: str | None) -> str:
+    """Return the text pydicom prints before an element's value."""
+    from pydicom.dataelem import DataElement  # noqa: PLC0415
+
+    # Only the name is cached, as the layout follows settings that callers
+    # may change at runtime
+
+    width = DataElement.descripWidth
+    name = f"{_element_name(tag, vr, private_creator)[:width]:<{width}}"
+    if DataElement.showVR:
+        return f"{tag} {name} {vr}: "
+    return f"{tag} {name} "
+
+
+def _private_creator(dcm: Dataset, tag: BaseTag) -> str | None:
+    """Return the private creator of a private element, as pydicom sets it."""
+    if not tag.is_private or tag.is_private_creator:
+        return None
+    creator = dcm.get((tag.group, tag.element >> 8))
+    return None if creator is None else creator.value
+
+
+def _is_deferred_array(elem: DataElement | RawDataElement) -> bool:
+    """
+    Check whether an element is a large byte array that was never read.
+
+    ``repval`` summarises such elements by their length alone, so they can
+    be formatted without reading their value from disk.
+
+    """
+    from pydicom.dataelem import DataElement, RawDataElement  # noqa: PLC0415
+
+    return (
+        isinstance(elem, RawDataElement)
+        and elem.value is None
+        and elem.VR in _SUMMARISED_VRS
+        and elem.length > DataElement.maxBytesToDisplay
+    )
+
+
+def _format_dataset(dcm: Dataset, indent: int = 0) -> str:
+    """
+    Format a dataset exactly as ``str(dcm)`` does.
+
+    Mirrors ``Dataset._pretty_str`` but looks element names up through a
+    cache shared by every file, rather than resolving them from pydicom's
+    dictionaries for each element of each file. Large byte elements whose
+    read was deferred are summarised without being read.
+
+    Args:
+        dcm: PyDICOM dataset object
+        indent: Nesting level of the dataset within sequences
+
+    Returns:
+        The formatted dataset.
+
+    """
+    import pydicom.config  # noqa: PLC0415
+
+    strings = []
+    indent_str = dcm.indent_chars * indent
+    nextindent_str = dcm.indent_chars * (indent + 1)
+
+    file_meta = getattr(dcm, "file_meta", None)
+    if file_meta and pydicom.config.show_file_meta:
+        strings.append(f"{'Dataset.file_meta ':-<49}")
+        strings.extend(
+            f"{indent_str}{_element_prefix(e.tag, e.VR, e.private_creator)}"
+            f"{e.repval or ''}"
+            for e in file_meta
+        )
+        strings.append(f"{'':-<49}")
+
+    for tag in sorted(dcm.keys()):
+        raw = dcm.get_item(tag, keep_deferred=True)
+        if _is_deferred_array(raw):
+            prefix = _element_prefix(tag, raw.VR, _private_creator(dcm, tag))
+            strings.append(f"{indent_str}{prefix}Array of {raw.length} elements")
+            continue
+
+        elem = dcm[tag]
+        if elem.VR == "SQ":
+            name = _element_name(elem.tag, elem.VR, elem.private_creator)
+            strings.append(
+                f"{indent_str}{elem.tag}  {name}  {len(elem.value)} item(s) ---- ",
+            )
+            for item in elem.value:
+                strings.append(_format_dataset(item, indent + 1))
+                strings.append(nextindent_str + "---------")
+        else:
+            prefix = _element_prefix(elem.tag, elem.VR, elem.private_creator)
+            strings.append(f"{indent_str}{prefix}{elem.repval or ''}")
+
+    return "\n".join(strings)
+
+
+def validate_files(files: Sequence[str | os.PathLike[str] | BinaryIO]) -> None:
+    """
+    Validate that DICOM files can be read without printing.
+
+    Only each file's preamble, "DICM" prefix and file meta information are
+    read, so files are not parsed in full.
+
+    Args:
+        files: List of paths to, or file-like objects of, DICOM files.
+
+    Raises:
+        DicomReadError: If files are missing or are not DICOM files.
+
+    """
+    check_dicom_files(files)
+
 
+def print_stats(
+    files: Sequence[str | os.PathLike[str] | BinaryIO],
+    tags: list[int | str] | None = None,
+) -> None:
+    """
+    Print DICOM information for the files.
 
-def validate_files(files: list[str]) -> None:
-    """Validate that DICOM files can be read without printing."""
-    load_dicom_files(files)
+    Args:
+        files: List of paths to, or file-like objects of, DICOM files.
+        tags: If given, only these tags, as integers or keywords, are read
+            and printed. All elements are printed by default.
 
+    Raises:
+        DicomReadError: If files are missing or are not DICOM files.
 
-def print_stats(files: list[str]) -> None:
-    """Print DICOM information for the files."""
-    dcms = load_dicom_files(files)
+    """
+    dcms = load_dicom_files(
+        files,
+        stop_before_pixels=True,
+        defer_size=_DEFER_SIZE,
+        specific_tags=tags,
+    )
 
+    # Buffer every file and write once, rather than locking and flushing
+    # stdout per file
+    buffer = io.StringIO()
+    write = buffer.write
     for f, dcm in zip(files, dcms, strict=True):
-        banner = "*" * 5 + f" {f} " + "*" * 5
-        print(banner, dcm, sep="\n")
+        write(f"{'*' * 5} {f} {'*' * 5}\n{_format_dataset(dcm)}\n")
+    sys.stdout.write(buffer.getvalue())
@@ -1,13 +1,25 @@
 """Custom exception classes for dicominfo."""
 
 
-class DicomReadError(Exception):
+class DicomInfoError(Exception):
+    """Base class for errors raised by dicominfo."""
+
+    __slots__ = ()
+
+
+class DicomReadError(DicomInfoError):
     """Raised when DICOM files cannot be read."""
 
+    __slots__ = ()
 
-class NoPixelDataError(Exception):
+
+class NoPixelDataError(DicomInfoError):
     """Raised when no DICOM files contain pixel data."""
 
+    __slots__ = ()
+
 
-class UnsupportedPixelDataError(Exception):
+class UnsupportedPixelDataError(DicomInfoError):
     """Raised when pixel data is not supported."""
+
+    __slots__ = ()
@@ -6,34 +6,183 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+    from typing import BinaryIO
 
-# Module imports
-import pydicom
-import pydicom.errors
+    from pydicom import Dataset
+
+# Python imports
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TypeVar
 
 from dicominfo.exceptions import DicomReadError
 
+_T = TypeVar("_T")
+
+# Below this many files the process pool start-up costs more than it saves
+_MIN_FILES_FOR_POOL = 4
 
-def load_dicom_files(files: list[str]) -> Sequence[pydicom.Dataset]:
+
+def _read_one(
+    path: str | os.PathLike[str] | BinaryIO,
+    *,
+    stop_before_pixels: bool = False,
+    defer_size: str | None = None,
+    specific_tags: list[int | str] | None = None,
+) -> Dataset:
     """
-    Load DICOM files and return a list of pydicom Dataset objects.
+    Read a single DICOM file.
 
-    Args:
-        files: List of file paths to DICOM files.
+    Module-level so that it can be pickled and sent to worker processes.
+    Deferred elements are read later from ``path`` by whichever process
+    accesses them.
 
-    Returns:
-        List of pydicom Dataset objects.
+    """
+    # pydicom is imported on first use to keep CLI start-up fast
+    import pydicom  # noqa: PLC0415
+
+    return pydicom.dcmread(
+        path,
+        stop_before_pixels=stop_before_pixels,
+        defer_size=defer_size,
+        specific_tags=specific_tags,
+    )
+
+
+def _is_path(file: str | os.PathLike[str] | BinaryIO) -> bool:
+    """Check whether a file is given by path rather than as a file object."""
+    return isinstance(file, str | os.PathLike)
+
+
+def _check_one(path: str | os.PathLike[str] | BinaryIO) -> None:
+    """
+    Check that a file starts like a DICOM file.
+
+    For paths, only the 128-byte preamble, the "DICM" prefix and the file
+    meta group are read, rather than the whole dataset. File-like objects
+    are parsed up to the pixel data with every element skipped, and are
+    left at the position they were checked from.
+
+    """
+    import pydicom  # noqa: PLC0415
+    import pydicom.filereader  # noqa: PLC0415
+
+    if _is_path(path):
+        pydicom.filereader.read_file_meta_info(os.fspath(path))
+        return
+
+    # dcmread checks the preamble and "DICM" prefix itself
+    start = path.tell()
+    try:
+        pydicom.dcmread(path, stop_before_pixels=True, specific_tags=[])
+    finally:
+        path.seek(start)
+
+
+def _map_files(
+    func: Callable[[str | os.PathLike[str] | BinaryIO], _T],
+    files: Sequence[str | os.PathLike[str] | BinaryIO],
+    max_workers: int | None = None,
+) -> list[_T]:
+    """
+    Apply ``func`` to each file, in a process pool if there are enough.
+
+    File-like objects cannot be shared with worker processes, so they are
+    always handled serially.
 
     Raises:
         DicomReadError: If files cannot be read due to FileNotFoundError
             or InvalidDicomError.
 
     """
+    import pydicom.errors  # noqa: PLC0415
+
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(files))
+
     try:
-        dcms = [pydicom.dcmread(f) for f in files]
+        if (
+            len(files) < _MIN_FILES_FOR_POOL
+            or max_workers == 1
+            or not all(_is_path(f) for f in files)
+        ):
+            return [func(f) for f in files]
+        chunksize = max(1, len(files) // (4 * max_workers))
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(func, files, chunksize=chunksize))
     except (FileNotFoundError, pydicom.errors.InvalidDicomError) as err:
         msg = f"Files could not be read due to {err}"
         raise DicomReadError(msg) from err
 
-    return dcms
+
+def load_dicom_files(
+    files: Sequence[str | os.PathLike[str] | BinaryIO],
+    *,
+    stop_before_pixels: bool = False,
+    defer_size: str | None = None,
+    specific_tags: list[int | str] | None = None,
+    max_workers: int | None = None,
+) -> Sequence[Dataset]:
+    """
+    Load DICOM files and return a list of pydicom Dataset objects.
+
+    Files are parsed in a process pool when there are enough of them to
+    amortise the pool start-up, and serially otherwise.
+
+    Args:
+        files: List of paths to, or file-like objects of, DICOM files.
+        stop_before_pixels: If True, stop reading each file before the
+            (7FE0,0010) *Pixel Data* element. Use this when only the header
+            is needed.
+        defer_size: If given, elements larger than this, e.g. "1 KB", are
+            not read until their value is accessed.
+        specific_tags: If given, only these tags, as integers or keywords,
+            are kept from each file. Other elements are skipped unparsed.
+        max_workers: Number of worker processes. Defaults to one per CPU,
+            1 reads the files serially.
+
+    Returns:
+        List of pydicom Dataset objects.
+
+    Raises:
+        DicomReadError: If files cannot be read due to FileNotFoundError
+            or InvalidDicomError.
+
+    """
+    return _map_files(
+        partial(
+            _read_one,
+            stop_before_pixels=stop_before_pixels,
+            defer_size=defer_size,
+            specific_tags=specific_tags,
+        ),
+        files,
+        max_workers,
+    )
+
+
+def check_dicom_files(
+    files: Sequence[str | os.PathLike[str] | BinaryIO],
+    *,
+    max_workers: int | None = None,
+) -> None:
+    """
+    Check that files are DICOM files, without reading their datasets.
+
+    Each file's preamble and file meta information are read, which is
+    enough to reject files that are missing or not DICOM at a fraction of
+    the cost of :func:`load_dicom_files`.
+
+    Args:
+        files: List of paths to, or file-like objects of, DICOM files.
+        max_workers: Number of worker processes. Defaults to one per CPU,
+            1 checks the files serially.
+
+    Raises:
+        DicomReadError: If files cannot be read due to FileNotFoundError
+            or InvalidDicomError.
+
+    """
+    _map_files(_check_one, files, max_workers)
@@ -7,8 +7,11 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from concurrent.futures import Future
 
     from matplotlib.axes import Axes
+    from matplotlib.backend_bases import CloseEvent, DrawEvent
+    from matplotlib.figure import Figure
     from matplotlib.image import AxesImage
     from numpy import ndarray
     from pydicom import Dataset
@@ -16,25 +19,101 @@ if TYPE_CHECKING:
 
 # Python imports
 import logging
-from pathlib import Path
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Module imports
-import matplotlib as mpl
-import matplotlib.figure
 import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider
+import numpy as np
+from matplotlib.colors import Normalize
+from matplotlib.transforms import Bbox
+from matplotlib.widgets import CheckButtons, Slider
 from mpl_toolkits.axes_grid1 import make_axes_locatable
+from PIL import Image
 
+from dicominfo._kernels import window_level_u8
 from dicominfo.exceptions import NoPixelDataError, UnsupportedPixelDataError
 from dicominfo.utils import load_dicom_files
 
 logger = logging.getLogger(__name__)
 
+# Tags of the elements that pydicom can decode into a pixel array. Integer
+# tags skip the keyword lookup that every keyword membership test makes.
+_PIXEL_DATA = 0x7FE00010
+_PIXEL_DATA_TAGS = (
+    _PIXEL_DATA,
+    0x7FE00008,  # Float Pixel Data
+    0x7FE00009,  # Double Float Pixel Data
+)
 
-def _get_image_type(dcm: Dataset, pixel_array: ndarray) -> str:
+# Elements larger than this, pixel data above all, are read from disk only
+# when decoded rather than with the rest of the dataset
+_DEFER_SIZE = "1 KB"
+
+# Transfer syntaxes whose pixel data can be memory-mapped as stored
+_UNCOMPRESSED_LITTLE_ENDIAN = (
+    "1.2.840.10008.1.2",  # Implicit VR Little Endian
+    "1.2.840.10008.1.2.1",  # Explicit VR Little Endian
+)
+
+# Bits allocated per pixel that map directly onto a numpy dtype
+_MAPPABLE_BITS = (8, 16, 32)
+
+# Upper bound on threads used to decode pixel data
+_MAX_DECODE_WORKERS = 8
+
+# Number of slices sampled when estimating a volume's display range
+_RANGE_SAMPLE_SLICES = 16
+
+# Percentiles used as the fixed display range of a volume
+_RANGE_PERCENTILES = (0.5, 99.5)
+
+# Volumes with more slices than this are browsed sparsely by default
+_PREVIEW_SLICES = 128
+
+# Largest lookup table used to quantize integer data
+_MAX_LUT_SIZE = 2**17
+
+# Volumes larger than this are quantized for display a slice at a time
+_MAX_QUANTIZED_BYTES = 256 * 1024**2
+
+# Slices larger than this multiple of their on-screen size are downsampled
+_DOWNSAMPLE_FACTOR = 2
+
+# Images are drawn without matplotlib's default antialiasing resampler,
+# which is costly on every redraw; large slices are downsampled up front
+_INTERPOLATION = "nearest"
+
+
+def _header_shape(dcm: Dataset) -> tuple[int, ...]:
+    """
+    Find the shape of a dataset's pixel array from its header alone.
+
+    Args:
+        dcm: PyDICOM dataset object
+
+    Returns:
+        The shape pydicom decodes the pixel data to.
+
+    """
+    shape = (dcm.get("Rows", 0), dcm.get("Columns", 0))
+    frames = int(dcm.get("NumberOfFrames") or 1)
+    samples_per_pixel = dcm.get("SamplesPerPixel", 1)
+    if frames > 1:
+        shape = (frames, *shape)
+    if samples_per_pixel > 1:
+        shape = (*shape, samples_per_pixel)
+    return shape
+
+
+def _get_image_type(dcm: Dataset, pixel_array: ndarray | None = None) -> str:
     """
     Determine the type of DICOM image based on metadata.
 
+    Without ``pixel_array``, the image is classified from its header alone,
+    so pixel data need not be decoded.
+
     Args:
         dcm: PyDICOM dataset object
         pixel_array: Numpy array of pixel data
@@ -43,34 +122,35 @@ def _get_image_type(dcm: Dataset, pixel_array: ndarray) -> str:
         One of: "2d_gray", "2d_rgb", "3d_volume", "unsupported"
 
     """
-    samples_per_pixel = getattr(dcm, "SamplesPerPixel", 1)
-    num_frames = getattr(dcm, "NumberOfFrames", None)
+    samples_per_pixel = dcm.get("SamplesPerPixel", 1)
+    num_frames = dcm.get("NumberOfFrames")
+    shape = _header_shape(dcm) if pixel_array is None else pixel_array.shape
 
     # RGB/Color images: SamplesPerPixel > 1 means color channels
     # Shape should be (height, width, 3) or (height, width, 4)
     if samples_per_pixel > 1:
-        if len(pixel_array.shape) == 3 and pixel_array.shape[2] in (3, 4):  # noqa: PLR2004
+        if len(shape) == 3 and shape[2] in (3, 4):  # noqa: PLR2004
             return "2d_rgb"
         logger.warning(
             "Unexpected shape %s for SamplesPerPixel=%d",
-            pixel_array.shape,
+            shape,
             samples_per_pixel,
         )
         return "unsupported"
 
     # Grayscale images
-    if len(pixel_array.shape) == 2:  # noqa: PLR2004
+    if len(shape) == 2:  # noqa: PLR2004
         return "2d_gray"
 
     # 3D data: could be multi-frame 2D (temporal/cine) or true 3D volume
     # For now, treat multi-frame as navigable slices
-    if len(pixel_array.shape) == 3:  # noqa: PLR2004
+    if len(shape) == 3:  # noqa: PLR2004
         # Verify shape is consistent with NumberOfFrames if present
-        if num_frames is not None and pixel_array.shape[0] != num_frames:
+        if num_frames is not None and shape[0] != num_frames:
             logger.warning(
                 "NumberOfFrames (%d) doesn't match pixel_array.shape[0] (%d)",
                 num_frames,
-                pixel_array.shape[0],
+                shape[0],
             )
         return "3d_volume"
 
@@ -78,41 +158,573 @@ def _get_image_type(dcm: Dataset, pixel_array: ndarray) -> str:
     return "unsupported"
 
 
+def _has_pixel_data(dcm: Dataset) -> bool:
+    """
+    Check whether a dataset has pixel data, without decoding it.
+
+    Args:
+        dcm: PyDICOM dataset object
+
+    Returns:
+        True if the dataset has a pixel data element.
+
+    """
+    # A tag lookup, unlike hasattr(dcm, "pixel_array"), decodes nothing
+    return any(tag in dcm for tag in _PIXEL_DATA_TAGS)
+
+
+def _memmap_pixels(dcm: Dataset) -> ndarray | None:
+    """
+    Memory-map the pixel data of an uncompressed multi-frame dataset.
+
+    Frames are then paged in from disk as they are viewed, rather than the
+    whole volume being read up front. Only pixel data that needs no
+    processing by pydicom is mapped: little endian, one sample per pixel,
+    and every allocated bit stored.
+
+    Args:
+        dcm: PyDICOM dataset object, read with its pixel data deferred
+
+    Returns:
+        Read-only memory-mapped array of shape (frames, rows, columns), or
+        None if the pixel data cannot be mapped.
+
+    """
+    from pydicom.dataelem import RawDataElement  # noqa: PLC0415
+
+    file_meta = getattr(dcm, "file_meta", None)
+    transfer_syntax = file_meta.get("TransferSyntaxUID") if file_meta else None
+    bits = dcm.get("BitsAllocated")
+    frames = int(dcm.get("NumberOfFrames") or 1)
+    if (
+        transfer_syntax not in _UNCOMPRESSED_LITTLE_ENDIAN
+        or not isinstance(dcm.filename, str)
+        or frames < 2  # noqa: PLR2004
+        or dcm.get("SamplesPerPixel", 1) != 1
+        or bits not in _MAPPABLE_BITS
+        or dcm.get("BitsStored") != bits
+    ):
+        return None
+
+    # A deferred element has not been read, but knows where its value is
+    elem = dcm.get_item(_PIXEL_DATA, keep_deferred=True)
+    shape = (frames, dcm.Rows, dcm.Columns)
+    signed = dcm.get("PixelRepresentation", 0)
+    dtype = np.dtype(f"<{'i' if signed else 'u'}{bits // 8}")
+    if (
+        not isinstance(elem, RawDataElement)
+        or elem.value is not None
+        or elem.length < np.prod(shape) * dtype.itemsize
+    ):
+        return None
+
+    return np.memmap(
+        dcm.filename,
+        dtype=dtype,
+        mode="r",
+        offset=elem.value_tell,
+        shape=shape,
+    )
+
+
+def _decode_pixels(dcm: Dataset) -> ndarray:
+    """
+    Decode the pixel data of a dataset.
+
+    Uncompressed multi-frame pixel data is memory-mapped where possible.
+
+    Args:
+        dcm: PyDICOM dataset object
+
+    Returns:
+        Numpy array of pixel data.
+
+    """
+    pixels = _memmap_pixels(dcm)
+    return dcm.pixel_array if pixels is None else pixels
+
+
+def _load_pixel_data(
+    files: list[str],
+) -> list[tuple[str, Dataset, Future[ndarray]]]:
+    """
+    Read DICOM files and start decoding their pixel data.
+
+    Files are first read without their large elements, so pixel data is
+    never read for files that are dropped, nor copied back from the
+    reading processes. Decoding then reads and decodes the pixel data on a
+    thread pool in the background, so the caller can build the figure
+    while it completes. The first decode of each transfer syntax also
+    loads pydicom's decoder plugins, which then happens off the main
+    thread too.
+
+    Args:
+        files: List of file paths to DICOM files.
+
+    Returns:
+        Tuples of (path, dataset, future pixel array) for files with pixel
+        data.
+
+    Raises:
+        UnsupportedPixelDataError: If a file's header gives its pixel data
+            unsupported dimensions.
+
+    """
+    images = [
+        (f, dcm)
+        for f, dcm in zip(
+            files,
+            load_dicom_files(files, defer_size=_DEFER_SIZE),
+            strict=True,
+        )
+        if _has_pixel_data(dcm)
+    ]
+    if not images:
+        return []
+
+    # Images whose headers already rule them out are rejected before any
+    # pixel data is decoded
+    for f, dcm in images:
+        if _get_image_type(dcm) == "unsupported":
+            msg = (
+                f"{os.path.basename(f)} has unsupported dimensions: "  # noqa: PTH119
+                f"{_header_shape(dcm)}"
+            )
+            logger.error("%s", msg)
+            raise UnsupportedPixelDataError(msg)
+
+    # Decode pixel data concurrently, most decoders release the GIL. The
+    # pool's threads finish the queued work after shutdown returns.
+    workers = min(_MAX_DECODE_WORKERS, len(images))
+    ex = ThreadPoolExecutor(max_workers=workers)
+    futures = [ex.submit(_decode_pixels, dcm) for _, dcm in images]
+    ex.shutdown(wait=False)
+
+    return [(f, dcm, future) for (f, dcm), future in zip(images, futures, strict=True)]
+
+
+def _decoded_pixels(future: Future[ndarray], filename: str) -> ndarray:
+    """
+    Wait for the pixel data of a file to be decoded.
+
+    Args:
+        future: Future pixel array from :func:`_load_pixel_data`
+        filename: Name of the file, for the error message
+
+    Returns:
+        Numpy array of pixel data.
+
+    Raises:
+        UnsupportedPixelDataError: If the pixel data cannot be decoded,
+            e.g. because Bits Allocated is missing.
+
+    """
+    try:
+        return future.result()
+    except AttributeError as err:
+        # pydicom reports missing required pixel elements this way
+        msg = f"{filename} pixel data could not be decoded: {err}"
+    logger.error("%s", msg)
+    raise UnsupportedPixelDataError(msg)
+
+
 def _create_slice_updater(  # noqa: PLR0913
     image_obj: AxesImage,
     axis: Axes,
     data: ndarray,
     fname: str,
     slider: Slider,
-    fig: mpl.figure.Figure,
+    fig: Figure,
+    *,
+    prepare: Callable[[ndarray], ndarray] | None = None,
 ) -> Callable[[float], None]:
-    """Factory for slider update callbacks."""  # noqa: D401
+    """
+    Factory for slider update callbacks.
+
+    Once the figure has been drawn, updates are blitted: only the image,
+    title and slider regions are redrawn instead of the whole figure. The
+    slider should have ``drawon`` set to False for this to pay off.
+
+    If given, ``prepare`` is applied to each slice before it is displayed.
+
+    Closing the figure releases the callback's views onto ``data``, so the
+    volume can be freed even while the slider is still referenced.
+
+    """  # noqa: D401
+    # Views onto each slice, built once so callbacks skip __getitem__. The
+    # title template and bound methods are likewise resolved up front.
+    slices = list(data)
+    title = f"{fname}\nSlice {{}}/{len(slices)}"
+    set_data = image_obj.set_data
+    set_title = axis.set_title
+    canvas = fig.canvas
+    background = None
+    region = None
+
+    def draw_animated() -> None:
+        axis.draw_artist(axis.title)
+        fig.draw_artist(slider.ax)
+
+    def on_draw(event: DrawEvent) -> None:
+        nonlocal background, region
+        if event.canvas is not canvas:
+            # Saving draws through a temporary canvas, e.g. for PDF or SVG,
+            # which cannot blit. Draw the animated artists into the file.
+            axis.title.draw(event.renderer)
+            slider.ax.draw(event.renderer)
+            return
+        region = Bbox.union(
+            [
+                axis.bbox,
+                axis.title.get_window_extent(),
+                slider.ax.get_tightbbox(),
+            ],
+        )
+        background = canvas.copy_from_bbox(region)
+        draw_animated()
+
+    if canvas.supports_blit:
+        # The title and slider change on every tick, so keep them out of
+        # the cached background
+        axis.title.set_animated(True)
+        slider.ax.set_animated(True)
+        canvas.mpl_connect("draw_event", on_draw)
+
+    def release(_event: CloseEvent) -> None:
+        slices.clear()
+
+    canvas.mpl_connect("close_event", release)
 
     def update(val: float) -> None:
-        slice_idx = int(slider.val)
-        image_obj.set_data(data[slice_idx])
-        axis.set_title(
-            f"{fname}\nSlice {slice_idx + 1}/{data.shape[0]}",
-        )
-        fig.canvas.draw_idle()
+        if not slices:
+            return
+        slice_idx = int(val)
+        frame = slices[slice_idx]
+        set_data(frame if prepare is None else prepare(frame))
+        set_title(title.format(slice_idx + 1))
+        if background is None:
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(background)
+            axis.draw_artist(image_obj)
+            draw_animated()
+            canvas.blit(region)
         logger.debug("Slider at slice %f for %s", val, fname)
 
     return update
 
 
+def _first_number(value: object) -> float | None:
+    """Return a numeric element value, or the first of several, as a float."""
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        value = value[0] if value else None
+    return float(value) if isinstance(value, int | float) else None
+
+
+def _header_window(dcm: Dataset) -> tuple[float, float] | None:
+    """
+    Find the display range given by a dataset's VOI window.
+
+    The window applies to rescaled (modality) values. Here it is mapped
+    back onto stored pixel values once, so pixels never need rescaling.
+
+    Args:
+        dcm: PyDICOM dataset object
+
+    Returns:
+        Tuple of (vmin, vmax) in stored pixel values, or None if the
+        dataset has no usable linear window.
+
+    """
+    center = _first_number(dcm.get("WindowCenter"))
+    width = _first_number(dcm.get("WindowWidth"))
+    if center is None or width is None or width < 1:
+        return None
+
+    function = dcm.get("VOILUTFunction") or "LINEAR"
+    if function == "LINEAR":
+        low = center - 0.5 - (width - 1) / 2
+        high = center - 0.5 + (width - 1) / 2
+    elif function == "LINEAR_EXACT":
+        low = center - width / 2
+        high = center + width / 2
+    else:
+        return None
+
+    slope = _first_number(dcm.get("RescaleSlope"))
+    intercept = _first_number(dcm.get("RescaleIntercept"))
+    slope = 1.0 if slope is None else slope
+    intercept = 0.0 if intercept is None else intercept
+    if slope <= 0:
+        return None
+    return (low - intercept) / slope, (high - intercept) / slope
+
+
+def _display_range(volume: ndarray) -> tuple[float, float]:
+    """
+    Estimate a fixed display range for a volume.
+
+    Percentiles are taken over a strided subset of slices so that very
+    large volumes are not scanned in full.
+
+    Args:
+        volume: Numpy array of shape (slices, rows, columns)
+
+    Returns:
+        Tuple of (vmin, vmax) for the colour scale.
+
+    """
+    stride = max(1, volume.shape[0] // _RANGE_SAMPLE_SLICES)
+    vmin, vmax = np.percentile(volume[::stride], _RANGE_PERCENTILES)
+    return float(vmin), float(vmax)
+
+
+def _screen_size(fig: Figure, ax: Axes) -> tuple[int, int]:
+    """Approximate on-screen (width, height) of ``ax`` in pixels."""
+    pos = ax.get_position()
+    fig_width, fig_height = fig.get_size_inches() * fig.dpi
+    return max(1, int(pos.width * fig_width)), max(1, int(pos.height * fig_height))
+
+
+def _quantize(image: ndarray, vmin: float, vmax: float) -> ndarray:
+    """
+    Window an image or volume to uint8.
+
+    Integer data is mapped through a lookup table, which is a single gather
+    rather than several full-array arithmetic passes. Other data, or
+    integer windows too wide for a table, are scaled arithmetically.
+
+    Args:
+        image: Numpy array of any shape
+        vmin: Value mapped to 0
+        vmax: Value mapped to 255
+
+    Returns:
+        uint8 array of the same shape as ``image``.
+
+    """
+    low = int(np.floor(vmin))
+    span = max(int(np.ceil(vmax)) - low, 1)
+    high = low + span
+    # Lay the table out so the clipped values index it directly, with
+    # negative values wrapping from the end, avoiding a widened copy
+    size = max(high + 1, 0) + max(-low, 0)
+    if np.issubdtype(image.dtype, np.integer) and size <= _MAX_LUT_SIZE:
+        lut = (np.arange(span + 1, dtype=np.int64) * 255 // span).astype(np.uint8)
+        table = np.zeros(size, dtype=np.uint8)
+        table[np.arange(low, high + 1) % size] = lut
+        return table[np.clip(image, low, high)]
+
+    scale = 255.0 / ((vmax - vmin) or 1.0)
+    return ((np.clip(image, vmin, vmax) - vmin) * scale).astype(np.uint8)
+
+
+def _resize_slice(image: ndarray, size: tuple[int, int]) -> ndarray:
+    """
+    Resize a uint8 slice with PIL.
+
+    Args:
+        image: 2D uint8 numpy array
+        size: Target (width, height) in pixels
+
+    Returns:
+        Resized uint8 array of shape (height, width).
+
+    """
+    resized = Image.fromarray(image).resize(size, Image.Resampling.BILINEAR)
+    return np.asarray(resized)
+
+
+def _add_volume(  # noqa: PLR0913
+    fig: Figure,
+    ax: Axes,
+    pixel_array: ndarray,
+    filename: str,
+    window: tuple[float, float] | None = None,
+    *,
+    quantize: bool = True,
+) -> tuple[Slider, CheckButtons | None]:
+    """
+    Show the first slice of a volume on ``ax`` with a slice slider.
+
+    Thick volumes are previewed sparsely: the slider steps over every n-th
+    slice so that about ``_PREVIEW_SLICES`` are reachable, and a "dense"
+    check box switches back to single-slice steps.
+
+    Args:
+        fig: Figure containing ``ax``
+        ax: Axes to draw the volume on
+        pixel_array: Numpy array of shape (slices, rows, columns)
+        filename: Name used in the axes title
+        window: Fixed (vmin, vmax) display range. Estimated from the volume
+            if not given.
+        quantize: If False, slices are shown bit-exact, neither quantized
+            to uint8 nor downsampled.
+
+    Returns:
+        The slider controlling the displayed slice and the dense mode check
+        box, or None if the volume is thin enough to browse densely.
+
+    """
+    # Contiguous so every slice is a cheap, cache-friendly view
+    volume = np.ascontiguousarray(pixel_array)
+
+    rows, columns = volume.shape[1:]
+
+    # Quantize to uint8 over a fixed window, so slider updates skip both
+    # autoscaling and matplotlib's normalisation. Volumes too large to copy
+    # are quantized a slice at a time instead.
+    vmin, vmax = _display_range(volume) if window is None else window
+    quantize_slices = quantize and volume.nbytes > _MAX_QUANTIZED_BYTES
+    if quantize and not quantize_slices:
+        volume = _quantize(volume, vmin, vmax)
+
+    # Slices much larger than the axes are downsampled once per tick with
+    # PIL rather than resampled by matplotlib on every draw
+    screen_width, screen_height = _screen_size(fig, ax)
+    oversized = max(rows, columns) > _DOWNSAMPLE_FACTOR * max(
+        screen_width,
+        screen_height,
+    )
+    size = None
+    if quantize and oversized:
+        ratio = min(screen_width / columns, screen_height / rows)
+        size = (max(1, round(columns * ratio)), max(1, round(rows * ratio)))
+
+    prepare = None
+    if quantize_slices or size is not None:
+        scale = 255.0 / ((vmax - vmin) or 1.0)
+        # Written in place on every tick. AxesImage.set_data copies what it
+        # is given, so the buffer is free to be reused straight away.
+        display_buffer = np.empty((rows, columns), dtype=np.uint8)
+
+        def prepare(image: ndarray) -> ndarray:
+            if quantize_slices:
+                image = window_level_u8(image, vmin, scale, display_buffer)
+            if size is not None:
+                image = _resize_slice(image, size)
+            return image
+
+    # Start with the first slice/frame, keeping data coordinates in
+    # original pixels even when downsampled
+    initial_slice = 0
+    first = volume[initial_slice]
+    im = ax.imshow(
+        first if prepare is None else prepare(first),
+        cmap="gray",
+        vmin=0 if quantize else vmin,
+        vmax=255 if quantize else vmax,
+        extent=(-0.5, columns - 0.5, rows - 0.5, -0.5),
+        interpolation=_INTERPOLATION,
+    )
+    ax.set_title(
+        f"{filename}\nSlice {initial_slice + 1}/{volume.shape[0]}",
+    )
+    ax.axis("off")
+
+    # Create slider axes to the right of the image
+    stride = max(1, volume.shape[0] // _PREVIEW_SLICES)
+    divider = make_axes_locatable(ax)
+    slider_ax = divider.append_axes("right", size="5%", pad=0.1)
+    slider = Slider(
+        slider_ax,
+        "Slice",
+        0,
+        volume.shape[0] - 1,
+        valinit=initial_slice,
+        valstep=stride,
+        orientation="vertical",
+    )
+    # Redrawing is left to the update callback, which blits
+    slider.drawon = False
+
+    slider.on_changed(
+        _create_slice_updater(
+            im,
+            ax,
+            volume,
+            filename,
+            slider,
+            fig,
+            prepare=prepare,
+        ),
+    )
+
+    if stride == 1:
+        return slider, None
+
+    # Toggle between sparse preview and every slice
+    dense_ax = divider.append_axes("bottom", size="8%", pad=0.05)
+    dense = CheckButtons(dense_ax, ["dense"])
+
+    def set_dense(_label: str | None) -> None:
+        slider.valstep = 1 if dense.get_status()[0] else stride
+
+    dense.on_clicked(set_dense)
+    return slider, dense
+
+
+def _release_on_close(fig: Figure, *references: list) -> None:
+    """
+    Clear lists of a figure's objects once its window is closed.
+
+    The widgets, and the volumes they reference, are then freed when the
+    window closes rather than with the last reference to the figure.
+
+    Args:
+        fig: Figure whose closing releases the objects
+        *references: Lists holding references to the figure's objects
+
+    """
+
+    def release(_event: CloseEvent) -> None:
+        for objects in references:
+            objects.clear()
+
+    fig.canvas.mpl_connect("close_event", release)
+
+
+def _add_shared_colorbar(fig: Figure, images: list[AxesImage]) -> None:
+    """
+    Give images one display range and a single colorbar.
+
+    The range spans every image's own display range, and one norm is
+    shared by all of the images and the colorbar.
+
+    Args:
+        fig: Figure containing the images
+        images: Non-empty list of images to share the colorbar
+
+    """
+    lows, highs = zip(*(im.get_clim() for im in images), strict=True)
+    norm = Normalize(vmin=min(lows), vmax=max(highs))
+    for im in images:
+        im.set_norm(norm)
+    fig.colorbar(images[0], ax=[im.axes for im in images], shrink=0.8)
+
+
 def display_images(
     files: list[str],
     max_cols: int | None = None,
+    *,
+    quantize: bool = True,
+    shared_colorbar: bool = False,
 ) -> None:
-    """Display DICOM images with interactive controls."""
-    dcms = load_dicom_files(files)
+    """
+    Display DICOM images with interactive controls.
 
-    # Check if any files have pixel data
-    files_with_pixels = [
-        (f, dcm)
-        for f, dcm in zip(files, dcms, strict=True)
-        if hasattr(dcm, "pixel_array")
-    ]
+    Args:
+        files: List of file paths to DICOM files.
+        max_cols: Maximum number of columns in the image grid.
+        quantize: If False, volumes are displayed bit-exact rather than
+            quantized to uint8 over a fixed window, at the cost of slower
+            slider updates.
+        shared_colorbar: If True, 2D grayscale images share one display
+            range and a single figure-wide colorbar, rather than each
+            having its own.
+
+    """
+    files_with_pixels = _load_pixel_data(files)
 
     if not files_with_pixels:
         msg = "No DICOM files with pixel data found."
@@ -123,73 +735,84 @@ def display_images(
     max_cols = int(num_images**0.5) if max_cols is None else max_cols
     cols = min(num_images, max_cols)
     rows = (num_images - 1) // cols + 1
-    fig = plt.figure(figsize=(5 * cols, 4 * rows))
-
-    # Store references to manage 3D sliders
+    # A single layout pass, rather than one per add_subplot/tight_layout.
+    # Pixel data is still being decoded in the background meanwhile.
+    fig, axes = plt.subplots(
+        rows,
+        cols,
+        figsize=(5 * cols, 4 * rows),
+        squeeze=False,
+        layout="constrained",
+    )
+
+    # Store references to manage 3D sliders, widgets without a live
+    # reference stop responding
     sliders = []
+    check_buttons = []
     axes_images: list[tuple[Axes, AxesImage, Slider | None, ndarray | None]] = []
-
-    for idx, (filepath, dcm) in enumerate(files_with_pixels, start=1):
-        pixel_array = dcm.pixel_array
-        filename = Path(filepath).name
+    gray_images: list[AxesImage] = []
+
+    # Fill each image's cell as soon as it is decoded, so fast files are
+    # drawn while slower ones are still decoding. Cells keep file order.
+    cells = {
+        future: (filepath, dcm, ax)
+        for (filepath, dcm, future), ax in zip(
+            files_with_pixels,
+            axes.flat,
+            strict=False,
+        )
+    }
+    for future in as_completed(cells):
+        filepath, dcm, ax = cells[future]
+        # A string split, rather than building a Path for every file
+        filename = os.path.basename(filepath)  # noqa: PTH119
+        pixel_array = _decoded_pixels(future, filename)
 
         # Determine image type based on DICOM metadata
         image_type = _get_image_type(dcm, pixel_array)
+        window = _header_window(dcm)
 
         if image_type == "2d_gray":
             # 2D grayscale image - simple display
-            ax = fig.add_subplot(rows, cols, idx)
-            im = ax.imshow(pixel_array, cmap="gray")
+            # The header window, or else the data range, instead of
+            # matplotlib autoscaling
+            vmin, vmax = window or (pixel_array.min(), pixel_array.max())
+            im = ax.imshow(
+                pixel_array,
+                cmap="gray",
+                vmin=vmin,
+                vmax=vmax,
+                interpolation=_INTERPOLATION,
+            )
             ax.set_title(filename)
             ax.axis("off")
-            plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+            if shared_colorbar:
+                gray_images.append(im)
+            else:
+                plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
             axes_images.append((ax, im, None, None))
 
         elif image_type == "2d_rgb":
             # 2D RGB/color image - display without grayscale colormap
-            ax = fig.add_subplot(rows, cols, idx)
-            im = ax.imshow(pixel_array)
+            im = ax.imshow(pixel_array, interpolation=_INTERPOLATION)
             ax.set_title(filename)
             ax.axis("off")
             axes_images.append((ax, im, None, None))
 
         elif image_type == "3d_volume":
             # 3D volume or multi-frame 2D - display with slider
-            ax = fig.add_subplot(rows, cols, idx)
-
-            # Start with the first slice/frame
-            initial_slice = 0
-            im = ax.imshow(pixel_array[initial_slice], cmap="gray")
-            ax.set_title(
-                f"{filename}\nSlice {initial_slice + 1}/{pixel_array.shape[0]}",
-            )
-            ax.axis("off")
-
-            # Create slider axes to the right of the image
-            divider = make_axes_locatable(ax)
-            slider_ax = divider.append_axes("right", size="5%", pad=0.1)
-            slider = Slider(
-                slider_ax,
-                "Slice",
-                0,
-                pixel_array.shape[0] - 1,
-                valinit=initial_slice,
-                valstep=1,
-                orientation="vertical",
-            )
-
-            slider.on_changed(
-                _create_slice_updater(
-                    im,
-                    ax,
-                    pixel_array,
-                    filename,
-                    slider,
-                    fig,
-                ),
+            slider, dense = _add_volume(
+                fig,
+                ax,
+                pixel_array,
+                filename,
+                window,
+                quantize=quantize,
             )
             sliders.append(slider)
-            axes_images.append((ax, im, slider, pixel_array))
+            if dense is not None:
+                check_buttons.append(dense)
+            axes_images.append((ax, ax.images[0], slider, pixel_array))
 
         else:
             # Unsupported dimensions
@@ -197,9 +820,13 @@ def display_images(
             logger.error("%s", msg)
             raise UnsupportedPixelDataError(msg)
 
-    plt.tight_layout()
-    if len(files_with_pixels) == 1 and axes_images[0][2] is not None:
-        # Adjust layout for single 3D image with slider
-        plt.subplots_adjust(bottom=0.15)
+    if gray_images:
+        _add_shared_colorbar(fig, gray_images)
+
+    _release_on_close(fig, sliders, check_buttons, axes_images)
+
+    # Drop unused cells of the grid
+    for ax in axes.flat[num_images:]:
+        ax.remove()
 
     plt.show()
@@ -5,6 +5,8 @@
 # Python imports
 import importlib
 from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,28 +18,95 @@ from dicominfo import (
     DicomReadError,
     NoPixelDataError,
     UnsupportedPixelDataError,
+    __version__,
     display_images,
+    main,
     print_stats,
 )
-from dicominfo.core import validate_files
+from dicominfo.core import _format_dataset, validate_files
 from dicominfo.utils import load_dicom_files
-from dicominfo.viewer import _create_slice_updater, _get_image_type
+from dicominfo.viewer import (
+    _create_slice_updater,
+    _decode_pixels,
+    _display_range,
+    _get_image_type,
+    _has_pixel_data,
+    _load_pixel_data,
+    _quantize,
+    _resize_slice,
+)
+from pydicom import Dataset
 
 matplotlib.use('Agg')
 
+# Datasets returned by mocked reads, built once and reset between tests.
+# The spec makes misspelled attributes fail rather than return a new mock.
+_MOCK_DATASETS = (MagicMock(spec=Dataset), MagicMock(spec=Dataset))
+
+# Errors raised by mocked entry points, built once
+_READ_ERR = DicomReadError("Test error message")
+_NO_PIX_ERR = NoPixelDataError("No pixel data")
+_UNSUPPORTED_ERR = UnsupportedPixelDataError("Unsupported Pixel Data")
+
+
+def _mock_dataset(
+    pixel_array: np.ndarray | None = None, **elements: object
+) -> MagicMock:
+    """Mock a dataset with the given elements and, optionally, pixel data."""
+    # Anything else, pixel_array included when not given, is missing
+    spec = [*elements, "get", "__contains__"]
+    if pixel_array is not None:
+        spec.append("pixel_array")
+    mock_dcm = MagicMock(spec=spec)
+    mock_dcm.configure_mock(**elements)
+    mock_dcm.get.side_effect = lambda key, default=None: elements.get(key, default)
+    mock_dcm.__contains__.return_value = pixel_array is not None
+    if pixel_array is not None:
+        mock_dcm.pixel_array = pixel_array
+    return mock_dcm
+
+
+class _FailFirstExecutor(Executor):
+    """Executor that fails its first call and never runs the others."""
+
+    def __init__(self) -> None:
+        self.futures: list[Future] = []
+
+    def submit(self, fn: Callable, /, *args: object, **kwargs: object) -> Future:
+        """Queue a call, failing it if it is the first."""
+        from pydicom.errors import InvalidDicomError
+
+        future: Future = Future()
+        if not self.futures:
+            future.set_exception(InvalidDicomError("not DICOM"))
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture(scope="session")
+def invalid_dicom_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write a non-DICOM file once per session and return its path."""
+    path = tmp_path_factory.mktemp("invalid") / "invalid.dcm"
+    path.write_bytes(b"This is not a DICOM file")
+    return str(path)
+
+
 class TestLazyImport:
     """Tests for __getattr__ lazy loading mechanism."""
 
-    def test_display_images_lazy_import(self) -> None:
+    def test_display_images_lazy_import(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that display_images is loaded lazily."""
         import sys
 
-        # Remove dicominfo modules from cache to test fresh import
+        # Remove dicominfo modules from cache to test fresh import,
+        # monkeypatch restores the originals afterwards
         modules_to_remove = [
             mod for mod in sys.modules if mod.startswith("dicominfo")
         ]
         for mod in modules_to_remove:
-            del sys.modules[mod]
+            monkeypatch.delitem(sys.modules, mod)
 
         # Import dicominfo fresh
         import dicominfo
@@ -52,6 +121,73 @@ class TestLazyImport:
         assert "dicominfo.viewer" in sys.modules
         assert callable(func)
 
+    def test_print_stats_cli_does_not_import_matplotlib(self) -> None:
+        """Test that printing metadata from the CLI never loads matplotlib."""
+        import subprocess
+        import sys
+
+        from pydicom import examples
+
+        code = (
+            "import sys\n"
+            "from dicominfo.cli import main\n"
+            f"sys.argv = ['dicom-info', {str(examples.get_path('ct'))!r}]\n"
+            "main()\n"
+            "assert 'matplotlib' not in sys.modules\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_viewer_import_does_not_import_numba(self) -> None:
+        """Test that Numba is only loaded once a kernel needs it."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from dicominfo import _kernels, viewer\n"
+            "assert 'numba' not in sys.modules\n"
+            "viewer.window_level_u8(np.zeros((2, 2)), 0.0, 1.0,"
+            " np.empty((2, 2), np.uint8))\n"
+            "assert ('numba' in sys.modules) == _kernels.HAS_NUMBA\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_version_cli_does_not_import_pydicom(self) -> None:
+        """Test that --version returns without loading pydicom."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from dicominfo.cli import main\n"
+            "sys.argv = ['dicom-info', '--version']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert 'pydicom' not in sys.modules\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr.decode()
+
     def test_invalid_attribute_raises_error(self) -> None:
         """Test that invalid attributes raise AttributeError."""
         import dicominfo
@@ -65,6 +201,7 @@ class TestLazyImport:
 
         # These should work without triggering lazy import of viewer
         assert hasattr(dicominfo, "__version__")
+        assert hasattr(dicominfo, "DicomInfoError")
         assert hasattr(dicominfo, "DicomReadError")
         assert hasattr(dicominfo, "main")
 
@@ -135,101 +272,232 @@ class TestVersion:
             importlib.reload(_version)
 
 
-class TestLoadDicomFiles:
-    """Tests for load_dicom_files function."""
+class TestExceptions:
+    """Tests for the exception hierarchy."""
 
-    def test_raises_dicom_read_error_on_file_not_found(self) -> None:
-        """Test that load_dicom_files raises DicomReadError when file is not found."""
-        with pytest.raises(DicomReadError, match="Files could not be read"):
-            load_dicom_files(["/nonexistent/file.dcm"])
+    @pytest.mark.parametrize(
+        "error", [DicomReadError, NoPixelDataError, UnsupportedPixelDataError]
+    )
+    def test_errors_share_base_class(self, error: type[Exception]) -> None:
+        """Test that every dicominfo error can be caught as DicomInfoError."""
+        from dicominfo import DicomInfoError
 
-    def test_raises_dicom_read_error_on_invalid_dicom(
-        self, tmp_path: Path
-    ) -> None:
-        """Test that load_dicom_files raises DicomReadError on invalid DICOM file."""
-        # Create a non-DICOM file
-        invalid_file = tmp_path / "invalid.dcm"
-        invalid_file.write_text("This is not a DICOM file")
+        with pytest.raises(DicomInfoError, match="message"):
+            raise error("message")
 
-        with pytest.raises(DicomReadError, match="Files could not be read"):
-            load_dicom_files([str(invalid_file)])
+    @pytest.mark.parametrize(
+        "error", [DicomReadError, NoPixelDataError, UnsupportedPixelDataError]
+    )
+    def test_errors_declare_empty_slots(self, error: type[Exception]) -> None:
+        """Test that no dicominfo error adds per-instance attributes."""
+        assert all(
+            cls.__slots__ == ()
+            for cls in error.__mro__
+            if cls.__module__ == "dicominfo.exceptions"
+        )
+
+
+# Every entry point that reads files reports unreadable ones the same way
+_READERS = [load_dicom_files, validate_files, print_stats, display_images]
+
+
+@pytest.mark.parametrize("reader", _READERS)
+def test_raises_dicom_read_error_on_file_not_found(
+    reader: Callable[[list], object],
+) -> None:
+    """Test that readers raise DicomReadError when a file is not found."""
+    with pytest.raises(DicomReadError) as exc_info:
+        reader(["/nonexistent/file.dcm"])
+
+    assert "Files could not be read" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("reader", _READERS)
+def test_raises_dicom_read_error_on_invalid_dicom(
+    reader: Callable[[list], object],
+) -> None:
+    """Test that readers raise DicomReadError on an invalid DICOM file."""
+    # An in-memory non-DICOM file
+    invalid_file = BytesIO(b"This is not a DICOM file")
+
+    with pytest.raises(DicomReadError) as exc_info:
+        reader([invalid_file])
+
+    assert "Files could not be read" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("reader", _READERS)
+def test_raises_dicom_read_error_on_invalid_dicom_path(
+    reader: Callable[[list], object], invalid_dicom_path: str
+) -> None:
+    """Test that readers raise DicomReadError on an invalid file on disk."""
+    with pytest.raises(DicomReadError) as exc_info:
+        reader([invalid_dicom_path])
+
+    assert "Files could not be read" in str(exc_info.value)
+
+
+class TestLoadDicomFiles:
+    """Tests for load_dicom_files function."""
 
-    @patch("dicominfo.utils.pydicom.dcmread")
+    @pytest.fixture(autouse=True)
+    def _reset_mock_datasets(self) -> None:
+        """Clear what earlier tests recorded on the shared mock datasets."""
+        for mock_dcm in _MOCK_DATASETS:
+            mock_dcm.reset_mock()
+
+    @patch("pydicom.dcmread")
     def test_returns_list_of_datasets(self, mock_dcmread: Callable) -> None:
         """Test that load_dicom_files returns a list of pydicom Dataset objects."""
         # Mock pydicom.dcmread to return mock Dataset objects
-        mock_dcm1 = MagicMock()
-        mock_dcm2 = MagicMock()
-        mock_dcmread.side_effect = [mock_dcm1, mock_dcm2]
+        mock_dcmread.side_effect = iter(_MOCK_DATASETS)
 
         result = load_dicom_files(["file1.dcm", "file2.dcm"])
 
         assert len(result) == 2
-        assert result[0] == mock_dcm1
-        assert result[1] == mock_dcm2
+        assert result[0] is _MOCK_DATASETS[0]
+        assert result[1] is _MOCK_DATASETS[1]
         assert mock_dcmread.call_count == 2
 
+    @patch("pydicom.dcmread")
+    def test_fails_fast_on_first_bad_file(self, mock_dcmread: Callable) -> None:
+        """Test that files after the first unreadable one are not read."""
+        from pydicom.errors import InvalidDicomError
+
+        mock_dcmread.side_effect = InvalidDicomError("not DICOM")
+        paths = [f"file{i}.dcm" for i in range(10)]
+
+        with pytest.raises(DicomReadError, match="not DICOM"):
+            load_dicom_files(paths, max_workers=1)
+
+        assert mock_dcmread.call_count == 1
+
+    def test_pool_cancels_queued_files_after_bad_file(self) -> None:
+        """Test that files still queued when a read fails are never read."""
+        executor = _FailFirstExecutor()
+
+        with (
+            patch("dicominfo.utils.ProcessPoolExecutor", return_value=executor),
+            pytest.raises(DicomReadError, match="not DICOM"),
+        ):
+            load_dicom_files([f"file{i}.dcm" for i in range(10)], max_workers=2)
+
+        assert len(executor.futures) == 10
+        assert all(future.cancelled() for future in executor.futures[1:])
+
 
 class TestValidateFiles:
     """Tests for validate_files function."""
 
-    def test_raises_dicom_read_error_on_file_not_found(self) -> None:
-        """Test that validate_files raises DicomReadError when file is not found."""
-        with pytest.raises(DicomReadError, match="Files could not be read"):
-            validate_files(["/nonexistent/file.dcm"])
+    def test_accepts_file_like_objects(self) -> None:
+        """Test that file-like objects are validated and left unconsumed."""
+        from pydicom import examples
+
+        ct_file = BytesIO(Path(examples.get_path("ct")).read_bytes())
 
-    def test_raises_dicom_read_error_on_invalid_dicom(
+        validate_files([ct_file] * 4)
+
+        assert ct_file.tell() == 0
+        assert load_dicom_files([ct_file])[0].Modality == "CT"
+
+    def test_raises_dicom_read_error_without_preamble(
         self, tmp_path: Path
     ) -> None:
-        """Test that validate_files raises DicomReadError on invalid DICOM file."""
-        # Create a non-DICOM file
-        invalid_file = tmp_path / "invalid.dcm"
-        invalid_file.write_text("This is not a DICOM file")
+        """Test that a dataset written without the DICM prefix is rejected."""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        no_preamble = tmp_path / "no_preamble.dcm"
+        ds.save_as(no_preamble, implicit_vr=True, little_endian=True)
 
         with pytest.raises(DicomReadError, match="Files could not be read"):
-            validate_files([str(invalid_file)])
+            validate_files([str(no_preamble)])
+
+    @patch("pydicom.dcmread")
+    def test_reads_only_file_meta(self, mock_dcmread: Callable) -> None:
+        """Test that validation never parses the full dataset."""
+        from pydicom import examples
 
+        paths = [str(examples.get_path("ct"))] * 5
 
-class TestPrintStats:
-    """Tests for print_stats function."""
+        validate_files(paths)
 
-    def test_raises_dicom_read_error_on_file_not_found(self) -> None:
-        """Test that print_stats raises DicomReadError when file is not found."""
-        with pytest.raises(DicomReadError, match="Files could not be read"):
-            print_stats(["/nonexistent/file.dcm"])
+        mock_dcmread.assert_not_called()
 
-    def test_raises_dicom_read_error_on_invalid_dicom(
-        self, tmp_path: Path
+    def test_raises_dicom_read_error_with_many_files(
+        self, invalid_dicom_path: str
     ) -> None:
-        """Test that print_stats raises DicomReadError on invalid DICOM file."""
-        # Create a non-DICOM file
-        invalid_file = tmp_path / "invalid.dcm"
-        invalid_file.write_text("This is not a DICOM file")
+        """Test that an invalid file among many is still reported."""
+        from pydicom import examples
+
+        paths = [str(examples.get_path("ct"))] * 4 + [invalid_dicom_path]
 
         with pytest.raises(DicomReadError, match="Files could not be read"):
-            print_stats([str(invalid_file)])
+            validate_files(paths)
 
+    @pytest.mark.parametrize("n_files", [1, 4])
+    def test_accepts_path_objects(self, n_files: int) -> None:
+        """Test that pathlib paths are validated, with and without the pool."""
+        from pydicom import examples
 
-class TestDisplayImages:
-    """Tests for display_images function."""
+        validate_files([examples.get_path("ct")] * n_files)
 
-    def test_raises_dicom_read_error_on_file_not_found(self) -> None:
-        """Test that display_images raises DicomReadError when file is not found."""
-        with pytest.raises(DicomReadError, match="Files could not be read"):
-            display_images(["/nonexistent/file.dcm"])
 
-    def test_raises_dicom_read_error_on_invalid_dicom(
-        self, tmp_path: Path
+class TestPrintStats:
+    """Tests for print_stats function."""
+
+    def test_reads_headers_only(self) -> None:
+        """Test that print_stats stops reading each file before pixel data."""
+        from pydicom import examples
+
+        ct_path = str(examples.get_path("ct"))
+        with patch(
+            "dicominfo.core.load_dicom_files", wraps=load_dicom_files
+        ) as mock_load:
+            print_stats([ct_path])
+
+        assert mock_load.call_args.kwargs["stop_before_pixels"] is True
+
+    def test_forwards_stop_before_pixels_to_dcmread(self) -> None:
+        """Test that pydicom is asked to stop before the pixel data."""
+        from unittest.mock import ANY
+
+        import pydicom
+        from pydicom import examples
+
+        with patch("pydicom.dcmread", wraps=pydicom.dcmread) as mock_dcmread:
+            print_stats([str(examples.get_path("ct"))])
+
+        mock_dcmread.assert_called_once_with(
+            ANY, stop_before_pixels=True, defer_size=ANY, specific_tags=None
+        )
+
+    def test_prints_only_requested_tags(
+        self, capsys: pytest.CaptureFixture[str]
     ) -> None:
-        """Test that display_images raises DicomReadError on invalid DICOM file."""
-        # Create a non-DICOM file
-        invalid_file = tmp_path / "invalid.dcm"
-        invalid_file.write_text("This is not a DICOM file")
+        """Test that tags limits the elements read and printed."""
+        from pydicom import examples
 
-        with pytest.raises(DicomReadError, match="Files could not be read"):
-            display_images([str(invalid_file)])
+        print_stats(
+            [str(examples.get_path("ct"))], tags=["Modality", 0x00100010]
+        )
+
+        # Dataset elements, after the file meta information
+        lines = [
+            line
+            for line in capsys.readouterr().out.splitlines()
+            if line.startswith("(") and not line.startswith("(0002")
+        ]
+        # pydicom always keeps Specific Character Set to decode text
+        assert len(lines) == 3
+        assert "Specific Character Set" in lines[0]
+        assert "Modality" in lines[1]
+        assert "Patient's Name" in lines[2]
+
+
+class TestDisplayImages:
+    """Tests for display_images function."""
 
-    @patch("dicominfo.utils.pydicom.dcmread")
+    @patch("pydicom.dcmread")
     def test_raises_no_pixel_data_error_when_no_pixel_data(
         self, mock_dcmread: Callable
     ) -> None:
@@ -238,9 +506,8 @@ class TestDisplayImages:
         When files have no pixel data.
 
         """
-        # Mock a DICOM file without pixel_array attribute
-        mock_dcm = MagicMock()
-        del mock_dcm.pixel_array  # Ensure pixel_array doesn't exist
+        # Mock a DICOM file without a Pixel Data element
+        mock_dcm = _mock_dataset(SOPInstanceUID="1.2.3")
         mock_dcmread.return_value = mock_dcm
 
         with pytest.raises(
@@ -248,7 +515,7 @@ class TestDisplayImages:
         ):
             display_images(["mock_file.dcm"])
 
-    @patch("dicominfo.utils.pydicom.dcmread")
+    @patch("pydicom.dcmread")
     def test_raises_unsupported_pixel_data_error_with_unknown_image_type(
         self, mock_dcmread: Callable
     ) -> None:
@@ -257,12 +524,12 @@ class TestDisplayImages:
         When files have incorrect pixel data shape.
         """
         # Mock a DICOM file with 4D pixel array (e.g., time series with multiple slices)
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
-        mock_dcm.NumberOfFrames = 10
         # 4D array: (time, slices, height, width) - currently unsupported
-        mock_dcm.pixel_array = np.zeros((5, 10, 256, 256), dtype=np.uint16)
-        mock_dcmread.return_value = mock_dcm
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros((5, 10, 256, 256), dtype=np.uint16),
+            SamplesPerPixel=1,
+            NumberOfFrames=10,
+        )
 
         with pytest.raises(
             UnsupportedPixelDataError,
@@ -270,6 +537,50 @@ class TestDisplayImages:
         ):
             display_images(["mock_file.dcm"])
 
+    @patch("dicominfo.viewer._decode_pixels")
+    @patch("pydicom.dcmread")
+    def test_unsupported_header_is_rejected_before_decoding(
+        self, mock_dcmread: Callable, mock_decode: Callable
+    ) -> None:
+        """Test that a header with unsupported dimensions skips decoding."""
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros((10, 8, 8, 3), dtype=np.uint8),
+            Rows=8,
+            Columns=8,
+            SamplesPerPixel=3,
+            NumberOfFrames=10,
+        )
+
+        with pytest.raises(
+            UnsupportedPixelDataError,
+            match=r"mock_file.dcm has unsupported dimensions: \(10, 8, 8, 3\)",
+        ):
+            display_images(["mock_file.dcm"])
+
+        mock_decode.assert_not_called()
+
+    @patch("pydicom.dcmread")
+    def test_undecodable_pixel_data_raises_unsupported_error(
+        self, mock_dcmread: Callable
+    ) -> None:
+        """Test that pixel data without Bits Allocated is reported."""
+        from pydicom.dataset import FileMetaDataset
+
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = "1.2.840.10008.1.2.1"
+        ds.Rows = ds.Columns = 4
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.PixelData = bytes(32)
+        mock_dcmread.return_value = ds
+
+        with pytest.raises(
+            UnsupportedPixelDataError,
+            match="mock_file.dcm pixel data could not be decoded",
+        ):
+            display_images(["mock_file.dcm"])
+
 
 class TestSliceUpdater:
     """Tests for the slider update callback logic."""
@@ -301,6 +612,22 @@ class TestSliceUpdater:
         mock_ax.set_title.assert_called_once_with("test.dcm\nSlice 4/5")
         mock_fig.canvas.draw_idle.assert_called_once()
 
+    def test_update_uses_callback_value(self) -> None:
+        """Test that update shows the slice passed in, not slider.val."""
+        mock_ax = MagicMock()
+        mock_im = MagicMock()
+        mock_slider = MagicMock()
+        mock_slider.val = 0
+        data = np.random.rand(5, 10, 10).astype(np.float32)
+
+        updater = _create_slice_updater(
+            mock_im, mock_ax, data, "test.dcm", mock_slider, MagicMock()
+        )
+        updater(4.0)
+
+        np.testing.assert_array_equal(mock_im.set_data.call_args[0][0], data[4])
+        mock_ax.set_title.assert_called_once_with("test.dcm\nSlice 5/5")
+
     def test_update_logs_debug_message(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test that update logs the slider value."""
         import logging
@@ -316,31 +643,570 @@ class TestSliceUpdater:
         )
 
         with caplog.at_level(logging.DEBUG, logger="dicominfo.viewer"):
-            updater(2.5)  # Note: function uses int(sldr.val), not the parameter
+            updater(2.5)
 
         assert "Slider at slice 2.500000 for file.dcm" in caplog.text
 
+    def test_update_blits_after_first_draw(self) -> None:
+        """Test that updates blit instead of redrawing the whole figure."""
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Slider
+
+        data = np.random.rand(5, 10, 10).astype(np.float32)
+        fig, ax = plt.subplots()
+        im = ax.imshow(data[0])
+        slider_ax = fig.add_axes((0.9, 0.1, 0.05, 0.8))
+        slider = Slider(slider_ax, "Slice", 0, 4, valstep=1)
+        slider.drawon = False
+        slider.on_changed(
+            _create_slice_updater(im, ax, data, "test.dcm", slider, fig)
+        )
+        fig.canvas.draw()
+
+        with (
+            patch.object(fig.canvas, "draw_idle") as mock_draw_idle,
+            patch.object(fig.canvas, "blit") as mock_blit,
+        ):
+            slider.set_val(2)
+
+        mock_draw_idle.assert_not_called()
+        mock_blit.assert_called_once()
+        np.testing.assert_array_equal(im.get_array(), data[2])
+        assert ax.get_title() == "test.dcm\nSlice 3/5"
+        plt.close(fig)
+
+    def test_blit_region_follows_resize(self) -> None:
+        """Test that the cached background is recaptured after a resize."""
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Slider
+
+        data = np.random.rand(5, 10, 10).astype(np.float32)
+        fig, ax = plt.subplots()
+        im = ax.imshow(data[0])
+        slider_ax = fig.add_axes((0.9, 0.1, 0.05, 0.8))
+        slider = Slider(slider_ax, "Slice", 0, 4, valstep=1)
+        slider.drawon = False
+        slider.on_changed(
+            _create_slice_updater(im, ax, data, "test.dcm", slider, fig)
+        )
+        fig.canvas.draw()
+        fig.set_size_inches(fig.get_size_inches() * 2)
+        fig.canvas.draw()
+
+        with patch.object(fig.canvas, "blit") as mock_blit:
+            slider.set_val(3)
+
+        region = mock_blit.call_args[0][0]
+        assert region.contains(*ax.bbox.max - 1)
+        plt.close(fig)
+
+    @pytest.mark.parametrize(
+        ("fmt", "expected"),
+        # SVG text is kept as text, so the animated title can be found
+        [("pdf", b"%PDF"), ("svg", b"vol.dcm")],
+    )
+    def test_figure_saves_to_vector_formats(
+        self, fmt: str, expected: bytes
+    ) -> None:
+        """Test that a figure with a volume saves to PDF and SVG."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo.viewer import _add_volume
+
+        fig, ax = plt.subplots()
+        slider, _ = _add_volume(fig, ax, np.zeros((5, 8, 8)), "vol.dcm")
+        fig.canvas.draw()
+        slider.set_val(2)
+
+        buffer = BytesIO()
+        with matplotlib.rc_context({"svg.fonttype": "none"}):
+            fig.savefig(buffer, format=fmt)
+
+        assert expected in buffer.getvalue()
+        # The interactive canvas still blits afterwards
+        with patch.object(fig.canvas, "blit") as mock_blit:
+            slider.set_val(3)
+        mock_blit.assert_called_once()
+        plt.close(fig)
+
+
+class TestDisplayRange:
+    """Tests for the _display_range helper."""
+
+    def test_range_covers_volume(self) -> None:
+        """Test that the range spans the bulk of the volume's values."""
+        volume = np.arange(10 * 20 * 20, dtype=np.int16).reshape(10, 20, 20)
+
+        vmin, vmax = _display_range(volume)
+
+        assert volume.min() <= vmin < vmax <= volume.max()
+
+    def test_range_of_constant_volume(self) -> None:
+        """Test that a constant volume gives a degenerate range."""
+        volume = np.full((4, 8, 8), 7, dtype=np.uint16)
+
+        assert _display_range(volume) == (7.0, 7.0)
+
+
+class TestHeaderWindow:
+    """Tests for the _header_window helper."""
+
+    @pytest.mark.parametrize(
+        ("elements", "expected"),
+        [
+            ({"WindowCenter": 40, "WindowWidth": 401}, (-160.5, 239.5)),
+            (
+                {"WindowCenter": [40, 600], "WindowWidth": [401, 1600]},
+                (-160.5, 239.5),
+            ),
+            (
+                {
+                    "WindowCenter": 40,
+                    "WindowWidth": 400,
+                    "VOILUTFunction": "LINEAR_EXACT",
+                },
+                (-160.0, 240.0),
+            ),
+            (
+                {
+                    "WindowCenter": 40,
+                    "WindowWidth": 401,
+                    "RescaleSlope": 2,
+                    "RescaleIntercept": -1024,
+                },
+                (431.75, 631.75),
+            ),
+        ],
+    )
+    def test_window_in_stored_values(
+        self, elements: dict, expected: tuple[float, float]
+    ) -> None:
+        """Test that the VOI window is mapped onto stored pixel values."""
+        from pydicom import Dataset
+
+        from dicominfo.viewer import _header_window
+
+        dcm = Dataset()
+        for keyword, value in elements.items():
+            setattr(dcm, keyword, value)
+
+        assert _header_window(dcm) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "elements",
+        [
+            {},
+            {"WindowCenter": 40},
+            {"WindowCenter": 40, "WindowWidth": 0},
+            {"WindowCenter": 40, "WindowWidth": 400, "VOILUTFunction": "SIGMOID"},
+            {"WindowCenter": 40, "WindowWidth": 400, "RescaleSlope": -1},
+        ],
+    )
+    def test_no_usable_window(self, elements: dict) -> None:
+        """Test that datasets without a linear window give None."""
+        from pydicom import Dataset
+
+        from dicominfo.viewer import _header_window
+
+        dcm = Dataset()
+        for keyword, value in elements.items():
+            setattr(dcm, keyword, value)
+
+        assert _header_window(dcm) is None
+
+    @patch("dicominfo.viewer.plt.show")
+    def test_display_uses_header_window(self, mock_show: Callable) -> None:
+        """Test that a 2D image is displayed over its header window."""
+        import matplotlib.pyplot as plt
+        from pydicom import examples
+
+        display_images([str(examples.get_path("mr"))])
+
+        mock_show.assert_called_once()
+        fig = plt.gcf()
+        assert fig.axes[0].images[0].get_clim() == (-200.0, 1399.0)
+        plt.close(fig)
+
+
+class TestResizeSlice:
+    """Tests for the _resize_slice helper."""
+
+    def test_resizes_uint8_slice(self) -> None:
+        """Test that slices are resized to the requested size."""
+        image = np.zeros((64, 32), dtype=np.uint8)
+
+        result = _resize_slice(image, (16, 32))
+
+        assert result.shape == (32, 16)
+        assert result.dtype == np.uint8
+
+    def test_large_volume_is_downsampled_for_display(self) -> None:
+        """Test that volumes much larger than the axes are downsampled."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo.viewer import _add_volume
+
+        fig = plt.figure(figsize=(2, 2), dpi=50)
+        ax = fig.add_subplot()
+        volume = np.zeros((3, 1024, 512), dtype=np.uint16)
+
+        slider, _ = _add_volume(fig, ax, volume, "big.dcm")
+        slider.set_val(1)
+
+        image = ax.images[0]
+        assert image.get_array().shape[0] < 1024
+        assert image.get_extent() == [-0.5, 511.5, 1023.5, -0.5]
+        plt.close(fig)
+
+
+class TestQuantize:
+    """Tests for the _quantize helper."""
+
+    def test_integer_volume_uses_full_uint8_range(self) -> None:
+        """Test that an integer window maps onto 0-255."""
+        volume = np.array([[-2000, -1000, 0, 1000, 3000]], dtype=np.int16)
+
+        result = _quantize(volume, vmin=-1000.0, vmax=1000.0)
+
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, [[0, 0, 127, 255, 255]])
+
+    def test_float_volume_is_scaled(self) -> None:
+        """Test that float data is windowed arithmetically."""
+        volume = np.array([0.0, 0.5, 1.0, 2.0])
+
+        result = _quantize(volume, vmin=0.0, vmax=1.0)
+
+        np.testing.assert_array_equal(result, [0, 127, 255, 255])
+
+    def test_volume_is_displayed_as_uint8(self) -> None:
+        """Test that volumes are quantized before display."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo.viewer import _add_volume
+
+        fig, ax = plt.subplots()
+        volume = np.arange(4 * 8 * 8, dtype=np.uint16).reshape(4, 8, 8)
+
+        _add_volume(fig, ax, volume, "vol.dcm")
+
+        image = ax.images[0]
+        assert image.get_array().dtype == np.uint8
+        assert image.get_clim() == (0, 255)
+        plt.close(fig)
+
+
+class TestKernels:
+    """Tests for the display kernels."""
+
+    @pytest.mark.parametrize("dtype", [np.int16, np.uint16, np.float32])
+    def test_window_level_u8_matches_numpy(self, dtype: type) -> None:
+        """Test that the kernel windows like the NumPy reference."""
+        from dicominfo._kernels import _window_level_u8_numpy, window_level_u8
+
+        src = np.linspace(-500, 1500, 64 * 48).reshape(64, 48).astype(dtype)
+        scale = 255.0 / 1000.0
+        expected = _window_level_u8_numpy(
+            src, 0.0, scale, np.empty(src.shape, dtype=np.uint8)
+        )
+        dst = np.empty(src.shape, dtype=np.uint8)
+
+        result = window_level_u8(src, 0.0, scale, dst)
+
+        assert result is dst
+        np.testing.assert_allclose(result, expected, atol=1)
+
+    def test_falls_back_to_numpy_when_numba_fails_to_import(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a broken Numba install falls back to NumPy, once."""
+        import sys
+
+        import dicominfo
+        from dicominfo import _kernels
+
+        # A None entry makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, "numba", None)
+        monkeypatch.delitem(sys.modules, "dicominfo._jit", raising=False)
+        monkeypatch.delattr(dicominfo, "_jit", raising=False)
+        monkeypatch.setattr(_kernels, "HAS_NUMBA", True)
+        _kernels._load_jit.cache_clear()
+        src = np.arange(-50, 50, dtype=np.int16).reshape(10, 10)
+        dst = np.empty(src.shape, dtype=np.uint8)
+
+        try:
+            _kernels.window_level_u8(src, -50.0, 1.0, dst)
+            assert _kernels._load_jit() is None
+            assert _kernels._load_jit.cache_info().misses == 1
+        finally:
+            _kernels._load_jit.cache_clear()
+
+        np.testing.assert_array_equal(dst, src + 50)
+
+
+class TestMemmapPixels:
+    """Tests for memory-mapping uncompressed pixel data."""
+
+    @staticmethod
+    def _write_volume(
+        path: Path,
+        pixels: np.ndarray,
+        bits_stored: int,
+        transfer_syntax: str = "1.2.840.10008.1.2.1",
+    ) -> str:
+        """Write a multi-frame MONOCHROME2 file and return its path."""
+        from pydicom.dataset import Dataset, FileMetaDataset
+        from pydicom.uid import MRImageStorage, generate_uid
+
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = transfer_syntax
+        ds.file_meta.MediaStorageSOPClassUID = MRImageStorage
+        ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+        ds.SOPClassUID = MRImageStorage
+        ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+        ds.NumberOfFrames, ds.Rows, ds.Columns = pixels.shape
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.BitsAllocated = pixels.itemsize * 8
+        ds.BitsStored = bits_stored
+        ds.HighBit = bits_stored - 1
+        ds.PixelRepresentation = int(pixels.dtype.kind == "i")
+        ds.PixelData = pixels.tobytes()
+        ds.save_as(path, enforce_file_format=True)
+        return str(path)
+
+    @pytest.mark.parametrize(
+        "transfer_syntax", ["1.2.840.10008.1.2", "1.2.840.10008.1.2.1"]
+    )
+    @pytest.mark.parametrize("dtype", [np.uint8, np.int16, np.uint16])
+    def test_uncompressed_volume_is_memory_mapped(
+        self, tmp_path: Path, transfer_syntax: str, dtype: type
+    ) -> None:
+        """Test that uncompressed volumes are mapped, matching pixel_array."""
+        import pydicom
+
+        from dicominfo.viewer import _DEFER_SIZE, _decode_pixels
+
+        pixels = np.arange(-300, 3 * 32 * 32 - 300).reshape(3, 32, 32).astype(dtype)
+        path = self._write_volume(
+            tmp_path / "volume.dcm",
+            pixels,
+            pixels.itemsize * 8,
+            transfer_syntax,
+        )
+        dcm = load_dicom_files([path], defer_size=_DEFER_SIZE)[0]
+
+        result = _decode_pixels(dcm)
+
+        assert isinstance(result, np.memmap)
+        np.testing.assert_array_equal(result, pydicom.dcmread(path).pixel_array)
+
+    def test_partially_stored_bits_are_decoded(self, tmp_path: Path) -> None:
+        """Test that pixel data pydicom has to mask is not mapped."""
+        import pydicom
+
+        from dicominfo.viewer import _DEFER_SIZE, _decode_pixels
+
+        pixels = np.full((3, 32, 32), 0xF001, dtype=np.uint16)
+        path = self._write_volume(tmp_path / "volume.dcm", pixels, 12)
+        dcm = load_dicom_files([path], defer_size=_DEFER_SIZE)[0]
+
+        result = _decode_pixels(dcm)
+
+        assert not isinstance(result, np.memmap)
+        np.testing.assert_array_equal(result, pydicom.dcmread(path).pixel_array)
+        assert result.max() == 1
+
+    def test_unquantized_mapped_volume_is_not_copied(self, tmp_path: Path) -> None:
+        """Test that a mapped volume reaches the slider without a copy."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo import viewer
+
+        pixels = np.arange(3 * 32 * 32, dtype=np.uint16).reshape(3, 32, 32)
+        path = self._write_volume(tmp_path / "volume.dcm", pixels, 16)
+        dcm = load_dicom_files([path], defer_size=viewer._DEFER_SIZE)[0]
+        volume = viewer._decode_pixels(dcm)
+        fig, ax = plt.subplots()
+
+        with patch(
+            "dicominfo.viewer._create_slice_updater",
+            wraps=viewer._create_slice_updater,
+        ) as mock_updater:
+            viewer._add_volume(fig, ax, volume, "volume.dcm", quantize=False)
+
+        data = mock_updater.call_args.args[2]
+        assert np.shares_memory(data, volume)
+        plt.close(fig)
+
+
+class TestSparsePreview:
+    """Tests for sparse browsing of thick volumes."""
+
+    def test_thin_volume_steps_every_slice(self) -> None:
+        """Test that thin volumes have no dense toggle."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo.viewer import _add_volume
+
+        fig, ax = plt.subplots()
+        slider, dense = _add_volume(fig, ax, np.zeros((10, 8, 8)), "thin.dcm")
+
+        assert slider.valstep == 1
+        assert dense is None
+        plt.close(fig)
+
+    def test_thick_volume_toggles_dense_mode(self) -> None:
+        """Test that thick volumes step sparsely until dense is checked."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo.viewer import _add_volume
+
+        fig, ax = plt.subplots()
+        slider, dense = _add_volume(fig, ax, np.zeros((300, 8, 8)), "thick.dcm")
+
+        assert slider.valstep == 2
+        assert dense is not None
+
+        dense.set_active(0)
+        assert slider.valstep == 1
+
+        dense.set_active(0)
+        assert slider.valstep == 2
+        plt.close(fig)
+
+
+class TestAddVolume:
+    """Tests for displaying volumes with _add_volume."""
+
+    def test_large_volume_is_quantized_per_slice(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that volumes over the size limit are windowed per slice."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo import viewer
+
+        monkeypatch.setattr(viewer, "_MAX_QUANTIZED_BYTES", 0)
+        fig, ax = plt.subplots()
+        volume = np.arange(4 * 8 * 8, dtype=np.int16).reshape(4, 8, 8)
+
+        slider, _ = viewer._add_volume(fig, ax, volume, "vol.dcm")
+        slider.set_val(3)
+
+        image = ax.images[0].get_array()
+        assert image.dtype == np.uint8
+        np.testing.assert_allclose(
+            image,
+            viewer._quantize(volume[3], *viewer._display_range(volume)),
+            atol=1,
+        )
+        plt.close(fig)
+
+    def test_per_slice_display_buffer_is_reused(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that slider ticks write into one preallocated buffer."""
+        import matplotlib.pyplot as plt
+        from matplotlib.image import AxesImage
+
+        from dicominfo import viewer
+
+        monkeypatch.setattr(viewer, "_MAX_QUANTIZED_BYTES", 0)
+        fig, ax = plt.subplots()
+        volume = np.arange(4 * 8 * 8, dtype=np.int16).reshape(4, 8, 8)
+
+        with patch.object(
+            AxesImage, "set_data", autospec=True, side_effect=AxesImage.set_data
+        ) as set_data:
+            slider, _ = viewer._add_volume(fig, ax, volume, "vol.dcm")
+            slider.set_val(1)
+            slider.set_val(2)
+
+        buffers = [c.args[1] for c in set_data.call_args_list[-2:]]
+        assert buffers[0] is buffers[1]
+        # The displayed image is a copy, so reusing the buffer is safe
+        assert ax.images[0].get_array() is not buffers[1]
+        plt.close(fig)
+
+    def test_slider_keeps_norm_fixed(self) -> None:
+        """Test that ticks hand over uint8 slices without touching the norm."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo.viewer import _add_volume
+
+        fig, ax = plt.subplots()
+        volume = np.arange(5 * 8 * 8, dtype=np.int16).reshape(5, 8, 8)
+        slider, _ = _add_volume(fig, ax, volume, "vol.dcm")
+        im = ax.images[0]
+
+        with patch.object(im.norm, "autoscale_None") as mock_autoscale:
+            slider.set_val(4)
+
+        mock_autoscale.assert_not_called()
+        assert im.get_array().dtype == np.uint8
+        assert (im.norm.vmin, im.norm.vmax) == (0, 255)
+        plt.close(fig)
+
+    def test_unquantized_volume_is_bit_exact(self) -> None:
+        """Test that quantize=False displays the stored slice values."""
+        import matplotlib.pyplot as plt
+
+        from dicominfo.viewer import _add_volume
+
+        fig, ax = plt.subplots()
+        volume = np.arange(5 * 8 * 8, dtype=np.int16).reshape(5, 8, 8)
+        slider, _ = _add_volume(fig, ax, volume, "vol.dcm", quantize=False)
+        slider.set_val(2)
+
+        im = ax.images[0]
+        np.testing.assert_array_equal(im.get_array(), volume[2])
+        assert im.get_clim() == pytest.approx(_display_range(volume))
+        plt.close(fig)
+
+    def test_closing_figure_releases_volume(self) -> None:
+        """Test that closing the figure frees the volume behind a slider."""
+        import gc
+        import weakref
+
+        import matplotlib.pyplot as plt
+        from matplotlib.backend_bases import CloseEvent
+
+        from dicominfo.viewer import _add_volume
+
+        fig, ax = plt.subplots()
+        volume = np.zeros((5, 8, 8), dtype=np.int16)
+        volume_ref = weakref.ref(volume)
+        slider, _ = _add_volume(fig, ax, volume, "vol.dcm", quantize=False)
+        del volume
+
+        event = CloseEvent("close_event", fig.canvas)
+        fig.canvas.callbacks.process("close_event", event)
+        gc.collect()
+
+        assert volume_ref() is None
+        # Late ticks are ignored rather than failing
+        slider.set_val(2)
+        plt.close(fig)
+
 
 class TestMain:
     """Tests for main CLI function."""
 
-    @patch("dicominfo.viewer.display_images")
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "--display", "mock_file.dcm"])
     def test_exits_with_code_1_on_unsupported_pixel_error(
         self,
-        mock_print_stats: Callable,  # noqa: ARG002
-        mock_display_images: Callable,
+        monkeypatch: pytest.MonkeyPatch,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test that main exits with code 1 on UnsupportedPixelDataError."""
-        from dicominfo import main
-        from dicominfo.exceptions import UnsupportedPixelDataError
-
-        # Mock print_stats to raise DicomReadError
-        mock_display_images.side_effect = UnsupportedPixelDataError(
-            "Unsupported Pixel Data",
+        monkeypatch.setattr("dicominfo.cli.print_stats", MagicMock())
+        # Mock display_images to raise UnsupportedPixelDataError
+        monkeypatch.setattr(
+            "dicominfo.viewer.display_images",
+            MagicMock(side_effect=_UNSUPPORTED_ERR),
         )
+        monkeypatch.setattr("sys.argv", ["dicom-info", "--display", "mock_file.dcm"])
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -349,18 +1215,18 @@ class TestMain:
         captured = capsys.readouterr()
         assert "Unsupported Pixel Data" in captured.out
 
-
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "/nonexistent/file.dcm"])
     def test_exits_with_code_1_on_dicom_read_error(
-        self, mock_print_stats: Callable, capsys: pytest.CaptureFixture[str]
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test that main exits with code 1 when DicomReadError is raised."""
-        from dicominfo import main
-        from dicominfo.exceptions import DicomReadError
-
         # Mock print_stats to raise DicomReadError
-        mock_print_stats.side_effect = DicomReadError("Test error message")
+        monkeypatch.setattr(
+            "dicominfo.cli.print_stats",
+            MagicMock(side_effect=_READ_ERR),
+        )
+        monkeypatch.setattr("sys.argv", ["dicom-info", "/nonexistent/file.dcm"])
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -369,21 +1235,19 @@ class TestMain:
         captured = capsys.readouterr()
         assert "Test error message" in captured.out
 
-    @patch("dicominfo.viewer.display_images")
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "-d", "mock_file.dcm"])
     def test_exits_with_code_1_on_no_pixel_data_error(
         self,
-        mock_print_stats: Callable,  # noqa: ARG002
-        mock_display_images: Callable,
+        monkeypatch: pytest.MonkeyPatch,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test that main exits with code 1 when NoPixelDataError is raised."""
-        from dicominfo import main
-        from dicominfo.exceptions import NoPixelDataError
-
+        monkeypatch.setattr("dicominfo.cli.print_stats", MagicMock())
         # Mock display_images to raise NoPixelDataError
-        mock_display_images.side_effect = NoPixelDataError("No pixel data")
+        monkeypatch.setattr(
+            "dicominfo.viewer.display_images",
+            MagicMock(side_effect=_NO_PIX_ERR),
+        )
+        monkeypatch.setattr("sys.argv", ["dicom-info", "-d", "mock_file.dcm"])
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -392,12 +1256,13 @@ class TestMain:
         captured = capsys.readouterr()
         assert "No pixel data" in captured.out
 
-    @patch("sys.argv", ["dicom-info", "--version"])
     def test_version_flag_exits_with_code_0(
-        self, capsys: pytest.CaptureFixture[str]
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test that --version flag displays version and exits."""
-        from dicominfo import __version__, main
+        monkeypatch.setattr("sys.argv", ["dicom-info", "--version"])
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -406,30 +1271,37 @@ class TestMain:
         captured = capsys.readouterr()
         assert __version__ in captured.out
 
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "-v", "mock_file.dcm"])
+    @pytest.mark.parametrize("flag", ["-v", "--verbose"])
     def test_verbose_flag_enables_debug_logging(
-        self, mock_print_stats: Callable, caplog: pytest.CaptureFixture[str]
+        self,
+        flag: str,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that -v/--verbose flag enables debug logging."""
         import logging
 
-        from dicominfo import main
+        mock_basic_config = MagicMock()
+        mock_print_stats = MagicMock()
+        monkeypatch.setattr("logging.basicConfig", mock_basic_config)
+        monkeypatch.setattr("dicominfo.cli.print_stats", mock_print_stats)
+        monkeypatch.setattr("sys.argv", ["dicom-info", flag, "mock_file.dcm"])
 
-        with caplog.at_level(logging.DEBUG):
-            main()
+        main()
 
-        # Check that basicConfig was called with DEBUG level
-        # We can't directly test the level, but we can verify the function ran
+        assert mock_basic_config.call_args.kwargs["level"] == logging.DEBUG
         mock_print_stats.assert_called_once()
 
-    @patch("dicominfo.core.validate_files")
-    @patch("sys.argv", ["dicom-info", "-q", "mock_file.dcm"])
+    @pytest.mark.parametrize("flag", ["-q", "--quiet"])
     def test_quiet_flag_suppresses_output(
-        self, mock_validate_files: Callable, capsys: pytest.CaptureFixture[str]
+        self,
+        flag: str,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test that -q/--quiet flag suppresses metadata output."""
-        from dicominfo import main
+        mock_validate_files = MagicMock()
+        monkeypatch.setattr("dicominfo.core.validate_files", mock_validate_files)
+        monkeypatch.setattr("sys.argv", ["dicom-info", flag, "mock_file.dcm"])
 
         main()
 
@@ -440,58 +1312,85 @@ class TestMain:
         captured = capsys.readouterr()
         assert captured.out == ""
 
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "--verbose", "mock_file.dcm"])
-    def test_verbose_long_flag_enables_debug_logging(
-        self, mock_print_stats: Callable, caplog: pytest.CaptureFixture[str]
+    def test_tags_passed_to_print_stats(
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test that --verbose flag enables debug logging."""
-        import logging
+        """Test that --tags keywords are passed on to print_stats."""
+        mock_print_stats = MagicMock()
+        monkeypatch.setattr("dicominfo.cli.print_stats", mock_print_stats)
+        monkeypatch.setattr(
+            "sys.argv",
+            ["dicom-info", "--tags", "PatientName, Modality", "mock_file.dcm"],
+        )
 
-        from dicominfo import main
+        main()
 
-        with caplog.at_level(logging.DEBUG):
+        mock_print_stats.assert_called_once_with(
+            ["mock_file.dcm"], tags=["PatientName", "Modality"]
+        )
+
+    def test_unknown_tag_shows_validation_error(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that an unknown --tags keyword exits with code 2."""
+        monkeypatch.setattr(
+            "sys.argv", ["dicom-info", "-t", "Modality,NotATag", "mock_file.dcm"]
+        )
+
+        with pytest.raises(SystemExit) as exc_info:
             main()
 
-        # Check that basicConfig was called with DEBUG level
-        # We can't directly test the level, but we can verify the function ran
-        mock_print_stats.assert_called_once()
+        assert exc_info.value.code == 2
+        captured = capsys.readouterr()
+        assert "unknown DICOM keyword(s): NotATag" in captured.err
 
-    @patch("dicominfo.core.validate_files")
-    @patch("sys.argv", ["dicom-info", "--quiet", "mock_file.dcm"])
-    def test_quiet_long_flag_suppresses_output(
-        self, mock_validate_files: Callable
+    @pytest.mark.parametrize("tags", ["", ",", " , "])
+    def test_empty_tags_shows_validation_error(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        tags: str,
     ) -> None:
-        """Test that --quiet flag suppresses metadata output."""
-        from dicominfo import main
+        """Test that --tags without any keyword exits with code 2."""
+        monkeypatch.setattr("sys.argv", ["dicom-info", "-t", tags, "mock_file.dcm"])
 
-        main()
+        with pytest.raises(SystemExit) as exc_info:
+            main()
 
-        # validate_files should be called instead of print_stats
-        mock_validate_files.assert_called_once()
+        assert exc_info.value.code == 2
+        captured = capsys.readouterr()
+        assert "no DICOM keywords given" in captured.err
 
-    @patch("sys.argv", ["dicom-info", "--display", "-c", "0", "mock_file.dcm"])
-    def test_zero_columns_shows_validation_error(
-        self, capsys: pytest.CaptureFixture[str]
+    def test_tags_with_quiet_shows_validation_error(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
-        """Test that --columns=0 shows validation error and exits with code 2."""
-        from dicominfo import main
+        """Test that --tags, which only filters metadata, rejects --quiet."""
+        monkeypatch.setattr(
+            "sys.argv", ["dicom-info", "-q", "-t", "Modality", "mock_file.dcm"]
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
 
         assert exc_info.value.code == 2
         captured = capsys.readouterr()
-        assert "--columns must be a positive integer" in captured.err
+        assert "--tags has no effect with --quiet" in captured.err
 
-    @patch(
-        "sys.argv", ["dicom-info", "--display", "-c", "-1", "mock_file.dcm"]
-    )
-    def test_negative_columns_shows_validation_error(
-        self, capsys: pytest.CaptureFixture[str]
+    @pytest.mark.parametrize("columns", ["0", "-1", "-100"])
+    def test_non_positive_columns_shows_validation_error(
+        self,
+        columns: str,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
-        """Test that --columns=-1 shows validation error and exits with code 2."""
-        from dicominfo import main
+        """Test that non-positive --columns shows an error and exits with code 2."""
+        monkeypatch.setattr(
+            "sys.argv", ["dicom-info", "--display", "-c", columns, "mock_file.dcm"]
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -500,15 +1399,15 @@ class TestMain:
         captured = capsys.readouterr()
         assert "--columns must be a positive integer" in captured.err
 
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "-c", "0", "mock_file.dcm"])
     def test_invalid_columns_with_no_display_is_ok(
         self,
-        mock_print_stats: Callable,
-        caplog: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test that --columns=0 is valid if no --display flag is passed."""
-        from dicominfo import main
+        mock_print_stats = MagicMock()
+        monkeypatch.setattr("dicominfo.cli.print_stats", mock_print_stats)
+        monkeypatch.setattr("sys.argv", ["dicom-info", "-c", "0", "mock_file.dcm"])
 
         main()
 
@@ -516,32 +1415,32 @@ class TestMain:
 
         assert "only applies to the --display flag" in caplog.text
 
-    @patch("dicominfo.viewer.display_images")
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "--display", "-c", "1", "mock_file.dcm"])
     def test_positive_columns_is_valid(
-        self,
-        mock_print_stats: Callable,
-        mock_display_images: Callable,  # noqa: ARG002
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that --columns=1 is accepted as valid."""
-        from dicominfo import main
+        mock_print_stats = MagicMock()
+        monkeypatch.setattr("dicominfo.cli.print_stats", mock_print_stats)
+        monkeypatch.setattr("dicominfo.viewer.display_images", MagicMock())
+        monkeypatch.setattr(
+            "sys.argv", ["dicom-info", "--display", "-c", "1", "mock_file.dcm"]
+        )
 
         main()
 
         # Should not raise SystemExit for valid columns value
         mock_print_stats.assert_called_once()
 
-    @patch("dicominfo.viewer.display_images")
-    @patch("dicominfo.cli.print_stats")
-    @patch("sys.argv", ["dicom-info", "-d", "-c", "5", "mock_file.dcm"])
     def test_positive_columns_passed_to_display_images(
-        self,
-        mock_print_stats: Callable,  # noqa: ARG002
-        mock_display_images: Callable,
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that valid --columns value is passed to display_images correctly."""
-        from dicominfo import main
+        mock_display_images = MagicMock()
+        monkeypatch.setattr("dicominfo.cli.print_stats", MagicMock())
+        monkeypatch.setattr("dicominfo.viewer.display_images", mock_display_images)
+        monkeypatch.setattr(
+            "sys.argv", ["dicom-info", "-d", "-c", "5", "mock_file.dcm"]
+        )
 
         main()
 
@@ -556,53 +1455,52 @@ class TestGetImageType:
 
     def test_2d_grayscale_image(self) -> None:
         """Test that 2D grayscale images are correctly identified."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 1
         pixel_array = np.zeros((256, 256), dtype=np.uint16)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "2d_gray"
 
     def test_2d_rgb_image(self) -> None:
         """Test that 2D RGB images are correctly identified."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 3
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 3
         pixel_array = np.zeros((256, 256, 3), dtype=np.uint8)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "2d_rgb"
 
     def test_2d_rgba_image(self) -> None:
         """Test that 2D RGBA images (4 channels) are correctly identified."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 4
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 4
         pixel_array = np.zeros((256, 256, 4), dtype=np.uint8)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "2d_rgb"
 
     def test_3d_volume_without_number_of_frames(self) -> None:
         """Test that 3D volume data is correctly identified."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
-        del mock_dcm.NumberOfFrames  # No NumberOfFrames attribute
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 1
         pixel_array = np.zeros((10, 256, 256), dtype=np.uint16)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "3d_volume"
 
     def test_3d_volume_with_number_of_frames(self) -> None:
         """Test that 3D volume with NumberOfFrames is correctly identified."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
-        mock_dcm.NumberOfFrames = 10
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 1
+        dcm.NumberOfFrames = 10
         pixel_array = np.zeros((10, 256, 256), dtype=np.uint16)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "3d_volume"
 
@@ -613,24 +1511,46 @@ class TestGetImageType:
 
         When NumberOfFrames doesn't match shape.
         """
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
-        mock_dcm.NumberOfFrames = 15
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 1
+        dcm.NumberOfFrames = 15
         pixel_array = np.zeros((10, 256, 256), dtype=np.uint16)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "3d_volume"
         assert "NumberOfFrames" in caplog.text
         assert "doesn't match" in caplog.text
 
+    @pytest.mark.parametrize(
+        ("elements", "expected"),
+        [
+            ({"Rows": 4, "Columns": 4}, "2d_gray"),
+            ({"Rows": 4, "Columns": 4, "SamplesPerPixel": 3}, "2d_rgb"),
+            ({"Rows": 4, "Columns": 4, "NumberOfFrames": 10}, "3d_volume"),
+            (
+                {"Rows": 4, "Columns": 4, "NumberOfFrames": 10, "SamplesPerPixel": 3},
+                "unsupported",
+            ),
+        ],
+    )
+    def test_classifies_from_header_without_pixel_array(
+        self, elements: dict[str, int], expected: str
+    ) -> None:
+        """Test that images are classified from their header alone."""
+        dcm = Dataset()
+        for keyword, value in elements.items():
+            setattr(dcm, keyword, value)
+
+        assert _get_image_type(dcm) == expected
+
     def test_unsupported_4d_array(self) -> None:
         """Test that 4D arrays are marked as unsupported."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 1
         pixel_array = np.zeros((10, 10, 256, 256), dtype=np.uint16)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "unsupported"
 
@@ -638,22 +1558,21 @@ class TestGetImageType:
         self, caplog: pytest.CaptureFixture[str]
     ) -> None:
         """Test that RGB images with unexpected shapes are unsupported."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 3
+        dcm = Dataset()
+        dcm.SamplesPerPixel = 3
         pixel_array = np.zeros((256, 256), dtype=np.uint8)  # Should be 3D
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "unsupported"
         assert "Unexpected shape" in caplog.text
 
     def test_defaults_samples_per_pixel_to_1(self) -> None:
         """Test that missing SamplesPerPixel defaults to 1."""
-        mock_dcm = MagicMock()
-        del mock_dcm.SamplesPerPixel  # Remove attribute
+        dcm = Dataset()
         pixel_array = np.zeros((256, 256), dtype=np.uint16)
 
-        result = _get_image_type(mock_dcm, pixel_array)
+        result = _get_image_type(dcm, pixel_array)
 
         assert result == "2d_gray"
 
@@ -662,15 +1581,15 @@ class TestDisplayImagesIntegration:
     """Integration tests for display_images with different DICOM types."""
 
     @patch("dicominfo.viewer.plt.show")
-    @patch("dicominfo.utils.pydicom.dcmread")
+    @patch("pydicom.dcmread")
     def test_displays_2d_grayscale_correctly(
         self, mock_dcmread: Callable, mock_show: Callable
     ) -> None:
         """Test that 2D grayscale images are displayed correctly."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
-        mock_dcm.pixel_array = np.zeros((256, 256), dtype=np.uint16)
-        mock_dcmread.return_value = mock_dcm
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros((256, 256), dtype=np.uint16),
+            SamplesPerPixel=1,
+        )
 
         display_images(["test.dcm"])
 
@@ -678,15 +1597,15 @@ class TestDisplayImagesIntegration:
         mock_show.assert_called_once()
 
     @patch("dicominfo.viewer.plt.show")
-    @patch("dicominfo.utils.pydicom.dcmread")
+    @patch("pydicom.dcmread")
     def test_displays_rgb_without_grayscale_colormap(
         self, mock_dcmread: Callable, mock_show: Callable
     ) -> None:
         """Test that RGB images are not displayed with grayscale colormap."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 3
-        mock_dcm.pixel_array = np.zeros((256, 256, 3), dtype=np.uint8)
-        mock_dcmread.return_value = mock_dcm
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros((256, 256, 3), dtype=np.uint8),
+            SamplesPerPixel=3,
+        )
 
         # The key is that it doesn't crash trying to slice RGB on axis 0
         display_images(["test_rgb.dcm"])
@@ -695,16 +1614,16 @@ class TestDisplayImagesIntegration:
         mock_show.assert_called_once()
 
     @patch("dicominfo.viewer.plt.show")
-    @patch("dicominfo.utils.pydicom.dcmread")
+    @patch("pydicom.dcmread")
     def test_displays_3d_volume_with_slider(
         self, mock_dcmread: Callable, mock_show: Callable
     ) -> None:
         """Test that 3D volumes are displayed with a slider."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
-        mock_dcm.NumberOfFrames = 10
-        mock_dcm.pixel_array = np.zeros((10, 256, 256), dtype=np.uint16)
-        mock_dcmread.return_value = mock_dcm
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros((10, 256, 256), dtype=np.uint16),
+            SamplesPerPixel=1,
+            NumberOfFrames=10,
+        )
 
         display_images(["test_3d.dcm"])
 
@@ -712,22 +1631,162 @@ class TestDisplayImagesIntegration:
         mock_show.assert_called_once()
 
     @patch("dicominfo.viewer.plt.show")
-    @patch("dicominfo.utils.pydicom.dcmread")
+    @patch("pydicom.dcmread")
     def test_handles_multi_frame_temporal_data(
         self, mock_dcmread: Callable, mock_show: Callable
     ) -> None:
         """Test that multi-frame temporal data is displayed with slider."""
-        mock_dcm = MagicMock()
-        mock_dcm.SamplesPerPixel = 1
-        mock_dcm.NumberOfFrames = 20
-        mock_dcm.pixel_array = np.zeros((20, 128, 128), dtype=np.uint16)
-        mock_dcmread.return_value = mock_dcm
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros((20, 128, 128), dtype=np.uint16),
+            SamplesPerPixel=1,
+            NumberOfFrames=20,
+        )
 
         display_images(["test_temporal.dcm"])
 
         # Should call show once
         mock_show.assert_called_once()
 
+    @pytest.mark.parametrize(
+        ("samples_per_pixel", "shape"),
+        [(1, (32, 32)), (3, (32, 32, 3)), (1, (4, 32, 32))],
+    )
+    @patch("dicominfo.viewer.plt.show")
+    @patch("pydicom.dcmread")
+    def test_images_use_nearest_interpolation(
+        self,
+        mock_dcmread: Callable,
+        mock_show: Callable,
+        samples_per_pixel: int,
+        shape: tuple[int, ...],
+    ) -> None:
+        """Test that every image type skips antialiased resampling."""
+        import matplotlib.pyplot as plt
+
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros(shape, dtype=np.uint8),
+            SamplesPerPixel=samples_per_pixel,
+            NumberOfFrames=None,
+        )
+
+        display_images(["test.dcm"])
+
+        mock_show.assert_called_once()
+        fig = plt.gcf()
+        assert fig.axes[0].images[0].get_interpolation() == "nearest"
+        plt.close(fig)
+
+    @patch("dicominfo.viewer.plt.show")
+    @patch("pydicom.dcmread")
+    def test_pixel_data_is_decoded_once_per_file(
+        self, mock_dcmread: Callable, mock_show: Callable
+    ) -> None:
+        """Test that each file's pixel_array is only accessed once."""
+        from unittest.mock import PropertyMock
+
+        mock_dcm = _mock_dataset(SamplesPerPixel=1, NumberOfFrames=10)
+        mock_dcm.__contains__.return_value = True
+        pixel_array = PropertyMock(
+            return_value=np.zeros((10, 64, 64), dtype=np.uint16)
+        )
+        type(mock_dcm).pixel_array = pixel_array
+        mock_dcmread.return_value = mock_dcm
+
+        display_images(["a.dcm", "b.dcm"])
+
+        mock_show.assert_called_once()
+        assert pixel_array.call_count == 2
+
+    @patch("dicominfo.viewer.plt.show")
+    @patch("pydicom.dcmread")
+    def test_unused_grid_cells_are_removed(
+        self, mock_dcmread: Callable, mock_show: Callable
+    ) -> None:
+        """Test that a partially filled grid keeps only image axes."""
+        import matplotlib.pyplot as plt
+
+        mock_dcmread.return_value = _mock_dataset(
+            np.zeros((32, 32), dtype=np.uint16),
+            SamplesPerPixel=1,
+        )
+
+        display_images(["a.dcm", "b.dcm", "c.dcm"], max_cols=2)
+
+        mock_show.assert_called_once()
+        fig = plt.gcf()
+        # Three images, each with a colorbar, and no empty fourth cell
+        assert len(fig.axes) == 6
+        assert sum(bool(ax.images) for ax in fig.axes) == 3
+        plt.close(fig)
+
+    @patch("dicominfo.viewer.plt.show")
+    @patch("pydicom.dcmread")
+    def test_images_keep_file_order_when_decoded_out_of_order(
+        self, mock_dcmread: Callable, mock_show: Callable
+    ) -> None:
+        """Test that each image fills its own cell whenever it is decoded."""
+        import threading
+
+        import matplotlib.pyplot as plt
+
+        first, second = (
+            _mock_dataset(
+                np.full((8, 8), value, dtype=np.uint16),
+                SamplesPerPixel=1,
+            )
+            for value in (1, 2)
+        )
+        mock_dcmread.side_effect = [first, second]
+        second_decoded = threading.Event()
+
+        def decode(dcm: MagicMock) -> np.ndarray:
+            # The first file finishes decoding only after the second
+            if dcm is first:
+                second_decoded.wait(timeout=5)
+            else:
+                second_decoded.set()
+            return dcm.pixel_array
+
+        with patch("dicominfo.viewer._decode_pixels", side_effect=decode):
+            display_images(["a.dcm", "b.dcm"], max_cols=2)
+
+        mock_show.assert_called_once()
+        fig = plt.gcf()
+        axes = [ax for ax in fig.axes if ax.images]
+        assert [ax.get_title() for ax in axes] == ["a.dcm", "b.dcm"]
+        assert [ax.images[0].get_array()[0, 0] for ax in axes] == [1, 2]
+        plt.close(fig)
+
+    @patch("dicominfo.viewer.plt.show")
+    @patch("pydicom.dcmread")
+    def test_shared_colorbar(
+        self, mock_dcmread: Callable, mock_show: Callable
+    ) -> None:
+        """Test that shared_colorbar gives 2D images one norm and colorbar."""
+        import matplotlib.pyplot as plt
+
+        mock_dcmread.side_effect = [
+            _mock_dataset(
+                np.full((32, 32), value, dtype=np.uint16),
+                SamplesPerPixel=1,
+                WindowCenter=center,
+                WindowWidth=101,
+            )
+            for value, center in ((10, 50.5), (20, 150.5), (30, 250.5))
+        ]
+
+        display_images(["a.dcm", "b.dcm", "c.dcm"], shared_colorbar=True)
+
+        mock_show.assert_called_once()
+        fig = plt.gcf()
+        images = [ax.images[0] for ax in fig.axes if ax.images]
+        # Three images and a single colorbar
+        assert len(fig.axes) == 4
+        assert len(images) == 3
+        assert all(im.norm is images[0].norm for im in images)
+        assert images[0].get_clim() == (0.0, 300.0)
+        plt.close(fig)
+
 
 class TestWithPydicomExamples:
     """Tests using real pydicom example datasets instead of mocks."""
@@ -754,6 +1813,78 @@ class TestWithPydicomExamples:
         assert result[0].Modality == "CT"
         assert result[1].Modality == "MR"
 
+    def test_load_dicom_files_stop_before_pixels(self) -> None:
+        """Test that stop_before_pixels skips the Pixel Data element."""
+        from pydicom import examples
+
+        ct_path = str(examples.get_path("ct"))
+        result = load_dicom_files([ct_path], stop_before_pixels=True)
+
+        assert "PixelData" not in result[0]
+        assert result[0].Modality == "CT"
+
+    def test_load_dicom_files_in_process_pool(self) -> None:
+        """Test that enough files are read through the pool in order."""
+        from pydicom import examples
+
+        paths = [
+            str(examples.get_path("ct")),
+            str(examples.get_path("mr")),
+            str(examples.get_path("ct")),
+            str(examples.get_path("mr")),
+        ]
+        result = load_dicom_files(paths, stop_before_pixels=True)
+
+        assert [dcm.Modality for dcm in result] == ["CT", "MR", "CT", "MR"]
+
+    def test_load_path_objects_in_process_pool(self) -> None:
+        """Test that pathlib paths are read through the pool like strings."""
+        from pydicom import examples
+
+        paths = [examples.get_path("ct"), examples.get_path("mr")] * 2
+        with patch(
+            "dicominfo.utils.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mock_pool:
+            result = load_dicom_files(
+                paths, stop_before_pixels=True, max_workers=2
+            )
+
+        mock_pool.assert_called_once()
+        assert [dcm.Modality for dcm in result] == ["CT", "MR", "CT", "MR"]
+
+    def test_process_pool_raises_dicom_read_error(self) -> None:
+        """Test that errors from worker processes become DicomReadError."""
+        from pydicom import examples
+
+        paths = [str(examples.get_path("ct"))] * 3 + ["/nonexistent/file.dcm"]
+
+        with pytest.raises(DicomReadError, match="Files could not be read"):
+            load_dicom_files(paths)
+
+    @pytest.mark.parametrize(("max_workers", "pooled"), [(1, False), (2, True)])
+    def test_load_dicom_files_max_workers(
+        self, max_workers: int, *, pooled: bool
+    ) -> None:
+        """Test that max_workers sizes the pool, with 1 reading serially."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        from pydicom import examples
+
+        paths = [str(examples.get_path("ct"))] * 4
+
+        with patch(
+            "dicominfo.utils.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mock_pool:
+            result = load_dicom_files(
+                paths, stop_before_pixels=True, max_workers=max_workers
+            )
+
+        assert [dcm.Modality for dcm in result] == ["CT"] * 4
+        if pooled:
+            mock_pool.assert_called_once_with(max_workers=max_workers)
+        else:
+            mock_pool.assert_not_called()
+
     def test_validate_files_with_real_examples(self) -> None:
         """Test validation with real example files - should not raise."""
         from pydicom import examples
@@ -838,6 +1969,94 @@ class TestWithPydicomExamples:
         assert "CT" in output or "Patient" in output
         assert "CompressedSamples" in output or "CT1" in output
 
+    def test_print_stats_banner_precedes_dataset(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that each file's banner is followed by its dataset."""
+        from pydicom import examples
+
+        ct_path = str(examples.get_path("ct"))
+        print_stats([ct_path])
+
+        output = capsys.readouterr().out
+        assert output.startswith(f"***** {ct_path} *****\n")
+        assert output.endswith("\n")
+
+    def test_print_stats_writes_once(self) -> None:
+        """Test that output for all files is written in a single call."""
+        from pydicom import examples
+
+        paths = [str(examples.get_path("ct")), str(examples.get_path("mr"))]
+        with patch("sys.stdout") as mock_stdout:
+            print_stats(paths)
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        assert output.startswith(f"***** {paths[0]} *****\n")
+        assert f"\n***** {paths[1]} *****\n" in output
+
+    def test_print_stats_skips_pixel_data(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that print_stats does not read the Pixel Data element."""
+        from pydicom import examples
+
+        ct_path = str(examples.get_path("ct"))
+        print_stats([ct_path])
+
+        captured = capsys.readouterr()
+        assert "Pixel Data" not in captured.out
+
+    @pytest.mark.parametrize("name", ["ct", "mr", "rgb_color", "waveform"])
+    def test_format_dataset_matches_str(self, name: str) -> None:
+        """Test that the cached formatter reproduces str(dataset)."""
+        import pydicom
+        from pydicom import examples
+
+        dcm = pydicom.dcmread(examples.get_path(name), stop_before_pixels=True)
+
+        assert _format_dataset(dcm) == str(dcm)
+
+    @pytest.mark.parametrize(
+        ("setting", "value"), [("showVR", False), ("descripWidth", 20)]
+    )
+    def test_format_dataset_follows_display_settings(
+        self, monkeypatch: pytest.MonkeyPatch, setting: str, value: object
+    ) -> None:
+        """Test that changing pydicom's display settings is not cached over."""
+        import pydicom
+        from pydicom import examples
+        from pydicom.dataelem import DataElement
+
+        dcm = pydicom.dcmread(examples.get_path("ct"), stop_before_pixels=True)
+        _format_dataset(dcm)
+        monkeypatch.setattr(DataElement, setting, value)
+
+        assert _format_dataset(dcm) == str(dcm)
+
+    def test_print_stats_does_not_read_large_byte_elements(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that large byte elements are summarised without being read."""
+        import pydicom
+        from pydicom import examples
+
+        dcm = examples.ct
+        block = dcm.private_block(0x0011, "DICOMINFO TEST", create=True)
+        block.add_new(0x01, "OB", b"\0" * 4096)
+        path = tmp_path / "private_blob.dcm"
+        dcm.save_as(path)
+
+        with patch(
+            "pydicom.filereader.read_deferred_data_element"
+        ) as mock_read_deferred:
+            print_stats([str(path)])
+
+        mock_read_deferred.assert_not_called()
+        expected = str(pydicom.dcmread(path, stop_before_pixels=True))
+        assert capsys.readouterr().out == f"***** {path} *****\n{expected}\n"
+        assert "Array of 4096 elements" in expected
+
     def test_print_stats_multiple_files(
         self, capsys: pytest.CaptureFixture[str]
     ) -> None:
@@ -912,6 +2131,71 @@ class TestWithPydicomExamples:
 
         mock_show.assert_called_once()
 
+    def test_has_pixel_data_checks_tags(self) -> None:
+        """Test that datasets without Pixel Data are recognised."""
+        from pydicom import Dataset, examples
+
+        dcm = Dataset()
+        dcm.Modality = "ECG"
+
+        assert not _has_pixel_data(dcm)
+        assert _has_pixel_data(examples.ct)
+
+    def test_has_pixel_data_recognises_float_pixel_data(self) -> None:
+        """Test that Float and Double Float Pixel Data count as pixel data."""
+        from pydicom import Dataset
+
+        for keyword, vr in (("FloatPixelData", "OF"), ("DoubleFloatPixelData", "OD")):
+            dcm = Dataset()
+            dcm.add_new(keyword, vr, b"\x00" * 8)
+
+            assert _has_pixel_data(dcm)
+
+    def test_decode_pixels_returns_pixel_array(self) -> None:
+        """Test that _decode_pixels returns the decoded pixel array."""
+        from pydicom import examples
+
+        dcm = load_dicom_files([str(examples.get_path("ct"))])[0]
+
+        np.testing.assert_array_equal(_decode_pixels(dcm), dcm.pixel_array)
+
+    def test_load_pixel_data_decodes_only_images(self) -> None:
+        """Test that pixel data is decoded in the background, waveforms dropped."""
+        from pydicom import examples
+
+        paths = [
+            str(examples.get_path("ct")),
+            str(examples.get_path("waveform")),
+            str(examples.get_path("mr")),
+        ]
+        result = _load_pixel_data(paths)
+
+        assert [f for f, _, _ in result] == [paths[0], paths[2]]
+        for _, dcm, future in result:
+            pixel_array = future.result()
+            assert isinstance(pixel_array, np.ndarray)
+            assert pixel_array.shape == (dcm.Rows, dcm.Columns)
+
+    def test_pixel_data_is_read_when_decoded(self) -> None:
+        """Test that pixel data is deferred until decoding, then read."""
+        from pydicom import examples
+
+        from dicominfo.viewer import _DEFER_SIZE
+
+        ct_path = str(examples.get_path("ct"))
+        with patch(
+            "dicominfo.viewer.load_dicom_files", wraps=load_dicom_files
+        ) as mock_load:
+            _load_pixel_data([ct_path])
+        mock_load.assert_called_once_with([ct_path], defer_size=_DEFER_SIZE)
+
+        dcm = load_dicom_files([ct_path], defer_size=_DEFER_SIZE)[0]
+        assert dcm.get_item(0x7FE00010, keep_deferred=True).value is None
+        assert _has_pixel_data(dcm)
+        np.testing.assert_array_equal(
+            _decode_pixels(dcm), examples.ct.pixel_array
+        )
+
     def test_jpeg2000_example_loads_correctly(self) -> None:
         """Test that JPEG2K compressed example loads without errors."""
         from pydicom import examples